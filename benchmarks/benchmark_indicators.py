@@ -0,0 +1,111 @@
+"""
+Benchmark the NumPy indicator kernel against the previous pandas implementation.
+
+Usage:
+    python benchmarks/benchmark_indicators.py [n_rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.indicators import INDICATOR_COLUMNS, compute_indicators  # noqa: E402
+
+
+def pandas_indicators(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reference implementation: chained pandas rolling/ewm calls, as used before the kernel.
+    """
+    df = data.copy()
+    for col in df.select_dtypes(include=[np.number]).columns:
+        df[col] = df[col].astype('float32')
+
+    df['SMA_20'] = df['Close'].rolling(window=20).mean().astype('float32')
+    df['SMA_50'] = df['Close'].rolling(window=50).mean().astype('float32')
+    df['EMA_20'] = df['Close'].ewm(span=20, adjust=False).mean().astype('float32')
+    df['EMA_50'] = df['Close'].ewm(span=50, adjust=False).mean().astype('float32')
+
+    delta = df['Close'].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=14).mean() / loss.rolling(window=14).mean()
+    df['RSI'] = (100 - (100 / (1 + rs))).astype('float32')
+
+    ema12 = df['Close'].ewm(span=12, adjust=False).mean()
+    ema26 = df['Close'].ewm(span=26, adjust=False).mean()
+    df['MACD'] = (ema12 - ema26).astype('float32')
+    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean().astype('float32')
+
+    bb_middle = df['Close'].rolling(window=20).mean()
+    bb_std = df['Close'].rolling(window=20).std()
+    df['BB_Middle'] = bb_middle.astype('float32')
+    df['BB_Upper'] = (bb_middle + (2.0 * bb_std)).astype('float32')
+    df['BB_Lower'] = (bb_middle - (2.0 * bb_std)).astype('float32')
+
+    high_low = df['High'] - df['Low']
+    high_close = np.abs(df['High'] - df['Close'].shift())
+    low_close = np.abs(df['Low'] - df['Close'].shift())
+    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    df['ATR'] = true_range.rolling(window=14).mean().astype('float32')
+
+    df['OBV'] = (np.sign(df['Close'].diff()) * df['Volume']).fillna(0).cumsum().astype('float32')
+
+    df = df.bfill().ffill()
+    for col in df.select_dtypes(include=[np.number]).columns:
+        df[col] = df[col].astype('float32')
+    return df
+
+
+def make_data(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.5, n_rows))
+    spread = np.abs(rng.normal(0.0, 0.5, n_rows))
+    return pd.DataFrame(
+        {
+            'Open': close + rng.normal(0.0, 0.1, n_rows),
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000, 1_000_000, n_rows).astype('float64')
+        },
+        index=pd.date_range('2000-01-01', periods=n_rows, freq='min')
+    ).astype('float32')
+
+
+def best_of(func, repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = make_data(n_rows)
+
+    reference = pandas_indicators(data)[INDICATOR_COLUMNS]
+    kernel, _ = compute_indicators(data, fill_nans=True)
+
+    # Compare relative to each column's scale, since OBV is far larger than RSI
+    scale = reference.abs().max().replace(0, 1)
+    max_rel_diff = ((kernel - reference).abs().max() / scale).max()
+
+    pandas_time = best_of(lambda: pandas_indicators(data))
+    kernel_time = best_of(lambda: compute_indicators(data, fill_nans=True))
+
+    print(f"rows:              {n_rows:,}")
+    print(f"pandas:            {pandas_time * 1000:8.1f} ms")
+    print(f"numpy kernel:      {kernel_time * 1000:8.1f} ms")
+    print(f"speedup:           {pandas_time / kernel_time:8.1f}x")
+    print(f"max relative diff: {max_rel_diff:.2e}")
+
+
+if __name__ == '__main__':
+    main()
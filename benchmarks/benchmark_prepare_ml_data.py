@@ -0,0 +1,98 @@
+"""
+Benchmark the mask-based prepare_ml_data against the previous DataFrame pipeline.
+
+Reports the best-of-three time and the peak memory allocated during one call
+(tracemalloc), next to the size of the input frame and of the returned X.
+
+Usage:
+    python benchmarks/benchmark_prepare_ml_data.py [n_rows]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.data_loader import DataLoader  # noqa: E402
+
+
+def pandas_prepare_ml_data(data: pd.DataFrame, target_column: str = 'Close', prediction_days: int = 1):
+    """
+    Reference implementation: copy, re-cast, concat, dropna and cast again, as used before the fast path.
+    """
+    df = data.copy()
+    for col in df.select_dtypes(include=[np.number]).columns:
+        df[col] = df[col].astype('float32')
+
+    feature_columns = [col for col in df.select_dtypes(include=[np.number]).columns if col != target_column]
+    y = pd.Series(df[target_column].shift(-prediction_days), name=target_column, index=df.index)
+    X = df[feature_columns]
+
+    valid_data = pd.concat([X, y.to_frame()], axis=1).dropna()
+    X_array = valid_data[feature_columns].values.astype('float32')
+    y_array = valid_data[target_column].values.astype('float32')
+    return X_array, y_array, valid_data.index
+
+
+def make_data(n_rows: int, n_features: int = 16, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    values = rng.normal(100.0, 5.0, (n_rows, n_features)).astype('float32')
+    columns = ['Close'] + [f'feature_{i}' for i in range(1, n_features)]
+    # Frozen-style input: one column-major float32 block, as handed out by the loader
+    return pd.DataFrame(
+        np.asfortranarray(values),
+        index=pd.date_range('2000-01-01', periods=n_rows, freq='min'),
+        columns=columns,
+        copy=False
+    )
+
+
+def best_of(func, repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = make_data(n_rows)
+    loader = DataLoader(prefetch_workers=1)
+
+    X_ref, y_ref, dates_ref = pandas_prepare_ml_data(data)
+    X, y, dates = loader.prepare_ml_data(data)
+    identical = np.array_equal(X, X_ref) and np.array_equal(y, y_ref) and dates.equals(dates_ref)
+
+    pandas_time = best_of(lambda: pandas_prepare_ml_data(data))
+    fast_time = best_of(lambda: loader.prepare_ml_data(data))
+    pandas_peak = peak_memory(lambda: pandas_prepare_ml_data(data))
+    fast_peak = peak_memory(lambda: loader.prepare_ml_data(data))
+
+    mib = 1024 ** 2
+    print(f"rows:              {n_rows:,} x {data.shape[1]} float32 columns")
+    print(f"input frame:       {data.memory_usage(index=False).sum() / mib:8.1f} MiB")
+    print(f"output X:          {X.nbytes / mib:8.1f} MiB (C-contiguous: {X.flags.c_contiguous})")
+    print(f"pandas:            {pandas_time * 1000:8.1f} ms, peak {pandas_peak / mib:8.1f} MiB")
+    print(f"mask fast path:    {fast_time * 1000:8.1f} ms, peak {fast_peak / mib:8.1f} MiB")
+    print(f"speedup:           {pandas_time / fast_time:8.1f}x")
+    print(f"identical output:  {identical}")
+
+
+if __name__ == '__main__':
+    main()
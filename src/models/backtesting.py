@@ -0,0 +1,203 @@
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .base_model import BaseModel
+from ..utils.shared_arrays import ArraySpec, SharedArray, attach_array
+
+# (train_start, train_stop, test_start, test_stop) row positions of one fold
+Fold = Tuple[int, int, int, int]
+
+
+def walk_forward_splits(
+    n_samples: int,
+    n_folds: int = 5,
+    expanding: bool = True,
+    train_size: Optional[int] = None,
+    test_size: Optional[int] = None,
+    gap: int = 0
+) -> List[Fold]:
+    """
+    Split a time-ordered sample range into consecutive train/test folds.
+
+    Test blocks follow each other up to the end of the data. Each fold trains
+    on the rows before its test block: all of them for an expanding window,
+    or the last train_size of them for a rolling window. The gap rows between
+    training and test are left out, e.g. to keep overlapping multi-day
+    targets from leaking into training.
+
+    Args:
+        n_samples: Number of time-ordered samples
+        n_folds: Number of test blocks
+        expanding: Whether training starts at the first row in every fold
+        train_size: Rows in the first (or every, for a rolling window) training set;
+            if None, the rows left before the first test block
+        test_size: Rows per test block (if None, n_samples // (n_folds + 1))
+        gap: Rows skipped between the training set and the test block
+
+    Returns:
+        List of (train_start, train_stop, test_start, test_stop) row positions
+    """
+    if n_folds < 1:
+        raise ValueError(f"n_folds must be at least 1, got {n_folds}")
+    if test_size is None:
+        test_size = n_samples // (n_folds + 1)
+    first_test = n_samples - n_folds * test_size
+    if train_size is None:
+        train_size = first_test - gap
+    if test_size < 1 or train_size < 1 or first_test - gap < train_size:
+        raise ValueError(
+            f"Not enough samples ({n_samples}) for {n_folds} folds of {test_size} test rows "
+            f"after {train_size} training rows and a gap of {gap}"
+        )
+
+    folds = []
+    for fold in range(n_folds):
+        test_start = first_test + fold * test_size
+        train_stop = test_start - gap
+        train_start = 0 if expanding else train_stop - train_size
+        folds.append((train_start, train_stop, test_start, test_start + test_size))
+    return folds
+
+
+# Worker-process state, set once per worker by _init_worker
+_worker_model: Optional[bytes] = None
+_worker_X: Optional[np.ndarray] = None
+_worker_y: Optional[np.ndarray] = None
+
+
+def _init_worker(model_bytes: bytes, X_spec: ArraySpec, y_spec: Optional[ArraySpec]) -> None:
+    global _worker_model, _worker_X, _worker_y
+    _worker_model = model_bytes
+    _worker_X = attach_array(X_spec)
+    _worker_y = attach_array(y_spec)
+
+
+def _fit_fold(model: BaseModel, X: np.ndarray, y: Optional[np.ndarray], fold: Fold) -> Dict[str, float]:
+    train_start, train_stop, test_start, test_stop = fold
+    y_train = None if y is None else y[train_start:train_stop]
+    y_test = None if y is None else y[test_start:test_stop]
+    model.train(X[train_start:train_stop], y_train)
+    try:
+        metrics = model.evaluate(X[test_start:test_stop], y_test)
+    except ValueError:
+        # A metric undefined on this block (e.g. a test block of trending prices
+        # falling into a single cluster) leaves the fold's metrics as NaN
+        return {}
+    return {name: float(value) for name, value in metrics.items()}
+
+
+def _run_fold(fold: Fold) -> Dict[str, float]:
+    # Each fold refits a fresh copy of the untrained model
+    return _fit_fold(pickle.loads(_worker_model), _worker_X, _worker_y, fold)
+
+
+class WalkForwardBacktester:
+    def __init__(
+        self,
+        model: BaseModel,
+        n_folds: int = 5,
+        expanding: bool = True,
+        train_size: Optional[int] = None,
+        test_size: Optional[int] = None,
+        gap: int = 0,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize a walk-forward evaluation of a model.
+
+        Every fold refits a copy of the model on past samples only and
+        evaluates it on the following block, so the metrics are out of
+        sample. Folds are fitted in parallel worker processes that read X
+        and y from shared memory instead of receiving copies.
+
+        Args:
+            model: Untrained model to refit in each fold (any BaseModel, e.g.
+                LinearRegressionModel, LogisticRegressionModel or KMeansModel)
+            n_folds: Number of test blocks
+            expanding: Whether to use an expanding (True) or rolling (False) training window
+            train_size: Rows in the first (or every, for a rolling window) training set
+            test_size: Rows per test block
+            gap: Rows skipped between each training set and its test block
+            max_workers: Number of worker processes (if None, one per CPU up to n_folds;
+                1 runs the folds in this process)
+        """
+        self.model = model
+        self.n_folds = n_folds
+        self.expanding = expanding
+        self.train_size = train_size
+        self.test_size = test_size
+        self.gap = gap
+        self.max_workers = max_workers
+
+    def run(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Refit and evaluate the model on every fold.
+
+        Args:
+            X: Time-ordered features, e.g. from DataLoader.prepare_ml_data
+            y: Time-ordered targets (None for clustering)
+
+        Returns:
+            Dictionary with 'folds' (DataFrame of row ranges and metrics per fold,
+            NaN where a fold's metrics are undefined), 'mean' and 'std' (metric
+            name -> value across the folds that could be scored)
+        """
+        folds = walk_forward_splits(
+            len(X),
+            n_folds=self.n_folds,
+            expanding=self.expanding,
+            train_size=self.train_size,
+            test_size=self.test_size,
+            gap=self.gap
+        )
+        model_bytes = pickle.dumps(self.model)
+        max_workers = self.max_workers or min(os.cpu_count() or 1, len(folds))
+
+        if max_workers == 1 or len(folds) == 1:
+            results = [_fit_fold(pickle.loads(model_bytes), X, y, fold) for fold in folds]
+        else:
+            results = self._run_parallel(model_bytes, X, y, folds, max_workers)
+
+        columns = ['train_start', 'train_stop', 'test_start', 'test_stop']
+        table = pd.concat(
+            [pd.DataFrame(folds, columns=columns), pd.DataFrame(results)],
+            axis=1
+        )
+        table.index.name = 'fold'
+        metric_names = list(dict.fromkeys(name for metrics in results for name in metrics))
+        # Folds without a metric are skipped; a metric no fold could score is NaN
+        with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return {
+                'folds': table,
+                'mean': {name: float(np.nanmean(table[name].to_numpy())) for name in metric_names},
+                'std': {name: float(np.nanstd(table[name].to_numpy())) for name in metric_names}
+            }
+
+    def _run_parallel(
+        self,
+        model_bytes: bytes,
+        X: np.ndarray,
+        y: Optional[np.ndarray],
+        folds: List[Fold],
+        max_workers: int
+    ) -> List[Dict[str, float]]:
+        shared_X = SharedArray(X)
+        shared_y = SharedArray(y) if y is not None else None
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(model_bytes, shared_X.spec, shared_y.spec if shared_y is not None else None)
+            ) as executor:
+                return list(executor.map(_run_fold, folds))
+        finally:
+            shared_X.close()
+            if shared_y is not None:
+                shared_y.close()
@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
 from typing import Tuple, Optional, Dict, Any
-from sklearn.metrics import mean_squared_error, r2_score, accuracy_score, silhouette_score
+from sklearn.metrics import mean_squared_error, r2_score, accuracy_score
+from .cluster_metrics import clustering_metrics
 
 class BaseModel(ABC):
     def __init__(self, name: str):
@@ -65,9 +66,16 @@ class BaseModel(ABC):
                 metrics['mse'] = mean_squared_error(y, predictions)
                 metrics['r2'] = r2_score(y, predictions)
             elif self.model_type == 'classification':
-                metrics['accuracy'] = accuracy_score(y, predictions)
+                if np.ndim(y) == 2:
+                    # Multi-output: mean accuracy over the target columns
+                    metrics['accuracy'] = float(np.mean([
+                        accuracy_score(y[:, k], predictions[:, k]) for k in range(y.shape[1])
+                    ]))
+                else:
+                    metrics['accuracy'] = accuracy_score(y, predictions)
             elif self.model_type == 'clustering':
-                metrics['silhouette'] = silhouette_score(X, predictions)
+                # Silhouette is quadratic in the rows; large inputs get the adaptive estimate
+                metrics.update(clustering_metrics(X, predictions))
         
         return metrics
     
@@ -111,8 +119,22 @@ class BaseModel(ABC):
                 index=self.feature_names if hasattr(self, 'feature_names') else None
             )
         elif hasattr(self.model, 'coef_'):
+            coef = np.asarray(self.model.coef_)
+            if coef.ndim > 1:
+                # One row per output or class: rank features by mean absolute weight
+                coef = np.abs(coef).mean(axis=0)
             return pd.Series(
-                self.model.coef_,
+                coef,
+                index=self.feature_names if hasattr(self, 'feature_names') else None
+            )
+        elif all(hasattr(estimator, 'coef_') for estimator in getattr(self.model, 'estimators_', [None])):
+            # Multi-output wrappers fit one estimator per target: average their
+            # mean absolute weights, so every target counts the same
+            coef = np.mean([
+                np.abs(np.atleast_2d(estimator.coef_)).mean(axis=0) for estimator in self.model.estimators_
+            ], axis=0)
+            return pd.Series(
+                coef,
                 index=self.feature_names if hasattr(self, 'feature_names') else None
             )
         return None
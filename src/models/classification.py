@@ -1,8 +1,10 @@
 from .base_model import BaseModel
 import numpy as np
+from sklearn.base import clone
 from sklearn.linear_model import LogisticRegression
+from sklearn.multioutput import MultiOutputClassifier
 from sklearn.preprocessing import StandardScaler
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 class LogisticRegressionModel(BaseModel):
     def __init__(
@@ -20,7 +22,8 @@ class LogisticRegressionModel(BaseModel):
             C: Inverse of regularization strength
         """
         super().__init__(name)
-        self.model = LogisticRegression(max_iter=max_iter, C=C)
+        self.estimator = LogisticRegression(max_iter=max_iter, C=C)
+        self.model = self.estimator
         self.scaler = StandardScaler()
         self.model_type = 'classification'
         self.feature_names = None
@@ -35,9 +38,12 @@ class LogisticRegressionModel(BaseModel):
         """
         Train the logistic regression model.
         
+        A 2D target (one column per prediction horizon) trains one classifier
+        per column on the shared scaled features in a single call.
+        
         Args:
             X: Training features
-            y: Training target
+            y: Training target, 1D or of shape (n_samples, n_outputs)
             feature_names: Optional list of feature names
             **kwargs: Additional training parameters
         """
@@ -48,6 +54,10 @@ class LogisticRegressionModel(BaseModel):
         X_scaled = self.scaler.fit_transform(X)
         
         # Train model
+        if np.ndim(y) == 2:
+            self.model = MultiOutputClassifier(clone(self.estimator))
+        else:
+            self.model = self.estimator
         self.model.fit(X_scaled, y)
         self.is_fitted = True
     
@@ -70,7 +80,7 @@ class LogisticRegressionModel(BaseModel):
         # Make predictions
         return self.model.predict(X_scaled)
     
-    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+    def predict_proba(self, X: np.ndarray) -> Union[np.ndarray, List[np.ndarray]]:
         """
         Get probability estimates for each class.
         
@@ -78,7 +88,7 @@ class LogisticRegressionModel(BaseModel):
             X: Features to predict on
             
         Returns:
-            Array of probability estimates
+            Array of probability estimates, or one array per output for a multi-output model
         """
         if not self.is_fitted:
             raise ValueError("Model must be trained before making predictions")
@@ -94,11 +104,14 @@ class LogisticRegressionModel(BaseModel):
         Get the model coefficients.
         
         Returns:
-            Tuple of (coefficients, feature_names)
+            Tuple of (coefficients, feature_names); coefficients is a list with
+            one array per output for a multi-output model
         """
         if not self.is_fitted:
             raise ValueError("Model must be trained before getting coefficients")
         
+        if self._is_multi_output():
+            return [est.coef_ for est in self.model.estimators_], self.feature_names
         return self.model.coef_, self.feature_names
     
     def get_intercept(self) -> float:
@@ -106,11 +119,13 @@ class LogisticRegressionModel(BaseModel):
         Get the model intercept.
         
         Returns:
-            Model intercept
+            Model intercept, or a list with one intercept per output for a multi-output model
         """
         if not self.is_fitted:
             raise ValueError("Model must be trained before getting intercept")
         
+        if self._is_multi_output():
+            return [est.intercept_ for est in self.model.estimators_]
         return self.model.intercept_
     
     def get_classes(self) -> np.ndarray:
@@ -118,9 +133,12 @@ class LogisticRegressionModel(BaseModel):
         Get the unique classes in the training data.
         
         Returns:
-            Array of unique classes
+            Array of unique classes, or a list with one array per output for a multi-output model
         """
         if not self.is_fitted:
             raise ValueError("Model must be trained before getting classes")
         
-        return self.model.classes_ 
\ No newline at end of file
+        return self.model.classes_
+    
+    def _is_multi_output(self) -> bool:
+        return isinstance(self.model, MultiOutputClassifier) 
\ No newline at end of file
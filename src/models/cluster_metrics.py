@@ -0,0 +1,283 @@
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import calinski_harabasz_score, davies_bouldin_score, silhouette_score
+
+# Inputs up to this many rows get the exact silhouette by default
+EXACT_SILHOUETTE_ROWS = 10_000
+
+# Memory for one block of pairwise distances; bounds the rows scored at once
+WORKING_MEMORY_BYTES = 64 * 1024 ** 2
+
+# Rows scored per step of the adaptive estimate before its error is checked
+ADAPTIVE_STEP_ROWS = 512
+
+
+def _check_labels(labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    clusters, codes = np.unique(labels, return_inverse=True)
+    if not 2 <= len(clusters) <= len(labels) - 1:
+        raise ValueError(
+            f"Number of labels is {len(clusters)}. Valid values are 2 to n_samples - 1 (inclusive)"
+        )
+    return codes.ravel(), np.bincount(codes.ravel())
+
+
+def _block_rows(n_samples: int, n_clusters: int) -> int:
+    # One float64 distance row plus its per-cluster sums per scored row
+    return max(WORKING_MEMORY_BYTES // (8 * (n_samples + n_clusters)), 1)
+
+
+def _silhouette_rows(
+    X: np.ndarray,
+    codes: np.ndarray,
+    counts: np.ndarray,
+    rows: np.ndarray,
+    sq_norms: np.ndarray
+) -> np.ndarray:
+    # Silhouette of the given rows against all samples, one block of rows at a time
+    n_clusters = len(counts)
+    one_hot = np.zeros((len(X), n_clusters))
+    one_hot[np.arange(len(X)), codes] = 1.0
+    values = np.empty(len(rows))
+    step = _block_rows(len(X), n_clusters)
+
+    for start in range(0, len(rows), step):
+        block = rows[start:start + step]
+        sq_dist = sq_norms[block, None] + sq_norms[None, :] - 2.0 * (X[block] @ X.T)
+        np.maximum(sq_dist, 0.0, out=sq_dist)
+        # Per-cluster sums of distances through one matrix product
+        sums = np.sqrt(sq_dist, out=sq_dist) @ one_hot
+        own = codes[block]
+        own_size = counts[own]
+        # The distance of a row to itself is 0, so the own-cluster sum needs no correction
+        with np.errstate(divide='ignore', invalid='ignore'):
+            a = sums[np.arange(len(block)), own] / (own_size - 1)
+            means = sums / counts
+        means[np.arange(len(block)), own] = np.inf
+        b = means.min(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = (b - a) / np.maximum(a, b)
+        # Rows alone in their cluster score 0, as in sklearn
+        values[start:start + len(block)] = np.where(own_size > 1, np.nan_to_num(s), 0.0)
+    return values
+
+
+def chunked_silhouette(X: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Exact mean silhouette computed in blocks of rows with bounded memory.
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+
+    Returns:
+        Mean silhouette coefficient over all rows
+    """
+    X = np.asarray(X, dtype=np.float64)
+    codes, counts = _check_labels(labels)
+    sq_norms = np.einsum('ij,ij->i', X, X)
+    return float(_silhouette_rows(X, codes, counts, np.arange(len(X)), sq_norms).mean())
+
+
+def sampled_silhouette(
+    X: np.ndarray,
+    labels: np.ndarray,
+    sample_size: int = 2_000,
+    random_state: Optional[int] = None
+) -> float:
+    """
+    Estimate the mean silhouette from a random sample of rows.
+
+    Each sampled row is scored exactly against all rows, so the estimate is
+    unbiased (unlike scoring a subsample against itself) and costs
+    O(sample_size * n_samples) instead of O(n_samples^2).
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+        sample_size: Rows to score
+        random_state: Seed of the row sample
+
+    Returns:
+        Estimated mean silhouette coefficient
+    """
+    X = np.asarray(X, dtype=np.float64)
+    codes, counts = _check_labels(labels)
+    rng = np.random.default_rng(random_state)
+    rows = rng.choice(len(X), size=min(sample_size, len(X)), replace=False)
+    sq_norms = np.einsum('ij,ij->i', X, X)
+    return float(_silhouette_rows(X, codes, counts, rows, sq_norms).mean())
+
+
+def adaptive_silhouette(
+    X: np.ndarray,
+    labels: np.ndarray,
+    tolerance: float = 0.005,
+    time_budget: Optional[float] = None,
+    random_state: Optional[int] = None
+) -> Tuple[float, float]:
+    """
+    Estimate the mean silhouette to a target standard error or time budget.
+
+    Rows are scored in random order, each exactly against all rows, until the
+    standard error of the running mean drops to tolerance, the time budget is
+    spent, or every row is scored (which gives the exact value).
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+        tolerance: Target standard error of the estimate
+        time_budget: Seconds after which the current estimate is returned (if None, no limit)
+        random_state: Seed of the row order
+
+    Returns:
+        Tuple of (estimated mean silhouette, standard error of the estimate)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    codes, counts = _check_labels(labels)
+    n_samples = len(X)
+    order = np.random.default_rng(random_state).permutation(n_samples)
+    sq_norms = np.einsum('ij,ij->i', X, X)
+    started = time.perf_counter()
+
+    total = total_sq = 0.0
+    scored = 0
+    while scored < n_samples:
+        values = _silhouette_rows(X, codes, counts, order[scored:scored + ADAPTIVE_STEP_ROWS], sq_norms)
+        total += values.sum()
+        total_sq += np.square(values).sum()
+        scored += len(values)
+
+        mean = total / scored
+        variance = max(total_sq / scored - mean ** 2, 0.0)
+        # Sampling without replacement: the error vanishes as the sample covers all rows
+        error = np.sqrt(variance / scored * (n_samples - scored) / max(n_samples - 1, 1))
+        if scored >= 2 * ADAPTIVE_STEP_ROWS and error <= tolerance:
+            break
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            break
+    return float(mean), float(error)
+
+
+def simplified_silhouette(X: np.ndarray, labels: np.ndarray, centers: Optional[np.ndarray] = None) -> float:
+    """
+    Centroid-based silhouette in O(n_samples * n_clusters).
+
+    Distances to cluster members are replaced by distances to the cluster
+    centroids: a is the distance to the own centroid and b the distance to
+    the nearest other one. This closely tracks the silhouette for compact,
+    convex clusters such as those found by K-means.
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+        centers: Centroid per label in sorted label order (if None, the cluster means)
+
+    Returns:
+        Mean simplified silhouette coefficient
+    """
+    X = np.asarray(X, dtype=np.float64)
+    codes, counts = _check_labels(labels)
+    if centers is None:
+        centers = np.zeros((len(counts), X.shape[1]))
+        np.add.at(centers, codes, X)
+        centers /= counts[:, None]
+    centers = np.asarray(centers, dtype=np.float64)
+
+    sq_dist = (
+        np.einsum('ij,ij->i', X, X)[:, None]
+        + np.einsum('ij,ij->i', centers, centers)[None, :]
+        - 2.0 * (X @ centers.T)
+    )
+    dist = np.sqrt(np.maximum(sq_dist, 0.0))
+    rows = np.arange(len(X))
+    a = dist[rows, codes]
+    dist[rows, codes] = np.inf
+    b = dist.min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.nan_to_num((b - a) / np.maximum(a, b))
+    return float(np.where(counts[codes] > 1, s, 0.0).mean())
+
+
+def silhouette(
+    X: np.ndarray,
+    labels: np.ndarray,
+    method: str = 'auto',
+    sample_size: int = 2_000,
+    tolerance: float = 0.005,
+    time_budget: Optional[float] = None,
+    random_state: Optional[int] = None
+) -> float:
+    """
+    Mean silhouette coefficient with a choice of exact and approximate methods.
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+        method: 'exact' (sklearn), 'chunked', 'sampled', 'adaptive', 'simplified', or
+            'auto' (exact up to EXACT_SILHOUETTE_ROWS rows, adaptive beyond)
+        sample_size: Rows scored by the sampled method
+        tolerance: Target standard error of the adaptive method
+        time_budget: Seconds the adaptive method may spend
+        random_state: Seed of the sampled and adaptive methods
+
+    Returns:
+        Mean silhouette coefficient (or its estimate)
+    """
+    if method == 'auto':
+        method = 'exact' if len(X) <= EXACT_SILHOUETTE_ROWS else 'adaptive'
+    if method == 'exact':
+        return float(silhouette_score(X, labels))
+    if method == 'chunked':
+        return chunked_silhouette(X, labels)
+    if method == 'sampled':
+        return sampled_silhouette(X, labels, sample_size=sample_size, random_state=random_state)
+    if method == 'adaptive':
+        return adaptive_silhouette(
+            X, labels, tolerance=tolerance, time_budget=time_budget, random_state=random_state
+        )[0]
+    if method == 'simplified':
+        return simplified_silhouette(X, labels)
+    raise ValueError(f"Unknown silhouette method: {method}")
+
+
+def clustering_metrics(
+    X: np.ndarray,
+    labels: np.ndarray,
+    silhouette_method: str = 'auto',
+    tolerance: float = 0.005,
+    time_budget: Optional[float] = None,
+    random_state: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Compute the clustering quality metrics shown for clustering models.
+
+    Calinski-Harabasz and Davies-Bouldin only compare rows with centroids,
+    so they are linear in the number of rows; the silhouette uses the given
+    method.
+
+    Args:
+        X: Features
+        labels: Cluster label per row
+        silhouette_method: Method passed to silhouette
+        tolerance: Target standard error of the adaptive silhouette
+        time_budget: Seconds the adaptive silhouette may spend
+        random_state: Seed of the approximate silhouette methods
+
+    Returns:
+        Dictionary with 'silhouette', 'calinski_harabasz' (higher is better)
+        and 'davies_bouldin' (lower is better)
+    """
+    return {
+        'silhouette': silhouette(
+            X,
+            labels,
+            method=silhouette_method,
+            tolerance=tolerance,
+            time_budget=time_budget,
+            random_state=random_state
+        ),
+        'calinski_harabasz': float(calinski_harabasz_score(X, labels)),
+        'davies_bouldin': float(davies_bouldin_score(X, labels))
+    }
@@ -1,9 +1,14 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from .base_model import BaseModel
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
-from typing import Optional, Tuple
+from threadpoolctl import threadpool_limits
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from sklearn.metrics import silhouette_score
+from .cluster_metrics import clustering_metrics, silhouette, simplified_silhouette
+from ..utils.shared_arrays import ArraySpec, SharedArray, attach_array
 
 class KMeansModel(BaseModel):
     def __init__(
@@ -11,7 +16,12 @@ class KMeansModel(BaseModel):
         name: str = "K-Means Clustering",
         n_clusters: int = 3,
         max_iter: int = 300,
-        random_state: Optional[int] = None
+        random_state: Optional[int] = None,
+        mini_batch: bool = False,
+        batch_size: int = 1024,
+        silhouette_method: str = 'auto',
+        silhouette_tolerance: float = 0.005,
+        silhouette_time_budget: Optional[float] = None
     ):
         """
         Initialize the K-means clustering model.
@@ -21,16 +31,34 @@ class KMeansModel(BaseModel):
             n_clusters: Number of clusters
             max_iter: Maximum number of iterations
             random_state: Random state for reproducibility
+            mini_batch: Whether to use mini-batch K-means, which also enables
+                streaming updates through partial_fit and fit_stream
+            batch_size: Rows per mini-batch
+            silhouette_method: Silhouette method used in evaluation ('auto', 'exact',
+                'chunked', 'sampled', 'adaptive' or 'simplified', see cluster_metrics)
+            silhouette_tolerance: Target standard error of the adaptive silhouette
+            silhouette_time_budget: Seconds the adaptive silhouette may spend (if None, no limit)
         """
         super().__init__(name)
-        self.model = KMeans(
-            n_clusters=n_clusters,
-            max_iter=max_iter,
-            random_state=random_state
-        )
+        if mini_batch:
+            self.model = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                max_iter=max_iter,
+                batch_size=batch_size,
+                random_state=random_state
+            )
+        else:
+            self.model = KMeans(
+                n_clusters=n_clusters,
+                max_iter=max_iter,
+                random_state=random_state
+            )
         self.scaler = StandardScaler()
         self.model_type = 'clustering'
         self.feature_names = None
+        self.silhouette_method = silhouette_method
+        self.silhouette_tolerance = silhouette_tolerance
+        self.silhouette_time_budget = silhouette_time_budget
     
     def train(
         self,
@@ -58,6 +86,51 @@ class KMeansModel(BaseModel):
         self.model.fit(X_scaled)
         self.is_fitted = True
     
+    def partial_fit(self, X: np.ndarray, feature_names: Optional[list] = None) -> None:
+        """
+        Update the scaler and the centroids with one chunk of data.
+        
+        The scaler statistics are updated incrementally, and the existing
+        centroids are re-expressed in the updated scaling before the chunk is
+        applied, so centroids from earlier chunks keep their position in the
+        original feature space.
+        
+        Args:
+            X: Chunk of features; the first chunk needs at least n_clusters rows
+            feature_names: Optional list of feature names
+        """
+        if not isinstance(self.model, MiniBatchKMeans):
+            raise ValueError("Streaming updates require a model created with mini_batch=True")
+        
+        if feature_names is not None:
+            self.feature_names = feature_names
+        
+        if self.is_fitted:
+            old_mean = self.scaler.mean_.copy()
+            old_scale = self.scaler.scale_.copy()
+        self.scaler.partial_fit(X)
+        if self.is_fitted:
+            centers = self.model.cluster_centers_ * old_scale + old_mean
+            self.model.cluster_centers_[...] = (centers - self.scaler.mean_) / self.scaler.scale_
+        
+        self.model.partial_fit(self.scaler.transform(X))
+        self.is_fitted = True
+    
+    def fit_stream(self, chunks: Iterable[np.ndarray], feature_names: Optional[list] = None) -> None:
+        """
+        Train on a stream of chunks, e.g. from DataLoader.iter_feature_chunks.
+        
+        Only one chunk is held in memory at a time. Calling it again on new
+        bars refreshes the centroids of an already trained model.
+        
+        Args:
+            chunks: Iterable of feature arrays with the same columns
+            feature_names: Optional list of feature names
+        """
+        for chunk in chunks:
+            if len(chunk):
+                self.partial_fit(chunk, feature_names=feature_names)
+    
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Predict cluster assignments for new data.
@@ -101,12 +174,38 @@ class KMeansModel(BaseModel):
         
         return self.model.inertia_
     
-    def get_silhouette_score(self, X: np.ndarray) -> float:
+    def evaluate(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Evaluate the clustering with the model's silhouette settings.
+        
+        Args:
+            X: Features to evaluate on
+            y: Ignored; present for a common interface with the other models
+            
+        Returns:
+            Dictionary with 'silhouette', 'calinski_harabasz' and 'davies_bouldin'
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be trained before evaluation")
+        
+        # The approximate silhouette methods sample rows with the model's seed
+        return clustering_metrics(
+            X,
+            self.predict(X),
+            silhouette_method=self.silhouette_method,
+            tolerance=self.silhouette_tolerance,
+            time_budget=self.silhouette_time_budget,
+            random_state=self.model.random_state
+        )
+    
+    def get_silhouette_score(self, X: np.ndarray, method: Optional[str] = None) -> float:
         """
         Calculate the silhouette score for the clustering.
         
         Args:
             X: Features to calculate score on
+            method: Silhouette method (if None, the model's silhouette_method);
+                'simplified' uses the fitted centroids
             
         Returns:
             Silhouette score
@@ -120,22 +219,47 @@ class KMeansModel(BaseModel):
         # Get predictions
         labels = self.model.predict(X_scaled)
         
+        method = method or self.silhouette_method
+        if method == 'simplified':
+            present = np.unique(labels)
+            return simplified_silhouette(X_scaled, labels, centers=self.model.cluster_centers_[present])
+        
         # Calculate silhouette score
-        return silhouette_score(X_scaled, labels)
+        return silhouette(
+            X_scaled,
+            labels,
+            method=method,
+            tolerance=self.silhouette_tolerance,
+            time_budget=self.silhouette_time_budget,
+            random_state=self.model.random_state
+        )
     
     def find_optimal_clusters(
         self,
         X: np.ndarray,
         max_clusters: int = 10,
-        metric: str = 'silhouette'
+        metric: str = 'silhouette',
+        sample_size: Optional[int] = None,
+        patience: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> Tuple[int, float]:
         """
         Find the optimal number of clusters using the specified metric.
         
+        The candidate k are fitted in parallel worker processes that read the
+        scaled data from shared memory. With sample_size, the silhouette of
+        every k is computed on the same random subsample instead of all rows,
+        which turns its O(n^2) cost into O(sample_size^2). With patience, the
+        sweep stops once that many consecutive k failed to improve the best
+        score; candidates beyond the stopping point are cancelled.
+        
         Args:
             X: Features to analyze
             max_clusters: Maximum number of clusters to try
             metric: Metric to use ('silhouette' or 'inertia')
+            sample_size: Rows used for the silhouette score (if None, all rows)
+            patience: Consecutive k without improvement before stopping (if None, try all k)
+            max_workers: Number of worker processes (if None, one per CPU; 1 fits in this process)
             
         Returns:
             Tuple of (optimal number of clusters, best score)
@@ -143,27 +267,115 @@ class KMeansModel(BaseModel):
         # Scale features
         X_scaled = self.scaler.fit_transform(X)
         
-        best_score = float('-inf') if metric == 'silhouette' else float('inf')
-        best_n_clusters = 2
+        sample = None
+        if metric == 'silhouette' and sample_size is not None and sample_size < len(X_scaled):
+            rng = np.random.default_rng(self.model.random_state)
+            sample = np.sort(rng.choice(len(X_scaled), size=sample_size, replace=False))
         
-        for n_clusters in range(2, max_clusters + 1):
-            # Create and fit model
-            kmeans = KMeans(
-                n_clusters=n_clusters,
-                random_state=self.model.random_state
+        candidates = list(range(2, max_clusters + 1))
+        max_workers = max_workers or min(os.cpu_count() or 1, len(candidates))
+        
+        if max_workers == 1 or len(candidates) <= 1:
+            scores = (
+                _score_clusters(X_scaled, n_clusters, self.model.random_state, metric, sample)
+                for n_clusters in candidates
             )
-            labels = kmeans.fit_predict(X_scaled)
-            
-            # Calculate score
-            if metric == 'silhouette':
-                score = silhouette_score(X_scaled, labels)
-                if score > best_score:
-                    best_score = score
-                    best_n_clusters = n_clusters
-            else:  # inertia
-                score = kmeans.inertia_
-                if score < best_score:
-                    best_score = score
-                    best_n_clusters = n_clusters
-        
-        return best_n_clusters, best_score 
\ No newline at end of file
+            return _select_clusters(candidates, scores, metric, patience)
+        
+        shared_X = SharedArray(X_scaled)
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sweep_worker,
+            initargs=(shared_X.spec, self.model.random_state, metric, sample, max_workers)
+        )
+        scores = _ordered_scores(executor, candidates, max_workers)
+        try:
+            return _select_clusters(candidates, scores, metric, patience)
+        finally:
+            # Closing the generator cancels the candidates queued past an early stop,
+            # so they are never fitted (shutdown's cancel_futures needs Python 3.9)
+            scores.close()
+            executor.shutdown(wait=True)
+            shared_X.close()
+
+
+def _select_clusters(
+    candidates: List[int],
+    scores: Iterator[float],
+    metric: str,
+    patience: Optional[int]
+) -> Tuple[int, float]:
+    best_score = float('-inf') if metric == 'silhouette' else float('inf')
+    best_n_clusters = 2
+    since_best = 0
+    
+    for n_clusters, score in zip(candidates, scores):
+        if score > best_score if metric == 'silhouette' else score < best_score:
+            best_score = score
+            best_n_clusters = n_clusters
+            since_best = 0
+        else:
+            since_best += 1
+            if patience is not None and since_best >= patience:
+                break
+    
+    return best_n_clusters, best_score
+
+
+def _ordered_scores(executor: ProcessPoolExecutor, candidates: List[int], in_flight: int) -> Iterator[float]:
+    # Keep a few fits running ahead and yield scores in order of k, so early
+    # stopping sees the same sequence as a sequential sweep
+    futures = {}
+    queued = iter(candidates)
+    try:
+        for n_clusters in candidates:
+            while len(futures) < in_flight:
+                k = next(queued, None)
+                if k is None:
+                    break
+                futures[k] = executor.submit(_score_in_worker, k)
+            yield futures.pop(n_clusters).result()
+    finally:
+        for future in futures.values():
+            future.cancel()
+
+
+def _score_clusters(
+    X_scaled: np.ndarray,
+    n_clusters: int,
+    random_state: Optional[int],
+    metric: str,
+    sample: Optional[np.ndarray]
+) -> float:
+    kmeans = KMeans(
+        n_clusters=n_clusters,
+        random_state=random_state
+    )
+    labels = kmeans.fit_predict(X_scaled)
+    if metric != 'silhouette':
+        return float(kmeans.inertia_)
+    if sample is not None:
+        return float(silhouette_score(X_scaled[sample], labels[sample]))
+    return float(silhouette_score(X_scaled, labels))
+
+
+# Worker-process state of the k sweep, set once per worker by _init_sweep_worker
+_sweep_args: Optional[tuple] = None
+
+
+def _init_sweep_worker(
+    X_spec: ArraySpec,
+    random_state: Optional[int],
+    metric: str,
+    sample: Optional[np.ndarray],
+    n_workers: int
+) -> None:
+    global _sweep_args
+    # Split the cores between the workers instead of every KMeans fit using all of them
+    threadpool_limits(limits=max((os.cpu_count() or 1) // n_workers, 1))
+    _sweep_args = (attach_array(X_spec), random_state, metric, sample)
+
+
+def _score_in_worker(n_clusters: int) -> float:
+    X_scaled, random_state, metric, sample = _sweep_args
+    return _score_clusters(X_scaled, n_clusters, random_state, metric, sample)
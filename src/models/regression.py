@@ -17,6 +17,12 @@ class LinearRegressionModel(BaseModel):
         self.scaler = StandardScaler()
         self.model_type = 'regression'
         self.feature_names = None
+        # Sufficient statistics of the online mode (see partial_fit)
+        self.n_samples_seen = 0
+        self._mean_x = None
+        self._mean_y = None
+        self._comoment_xx = None
+        self._comoment_xy = None
     
     def train(
         self,
@@ -43,6 +49,94 @@ class LinearRegressionModel(BaseModel):
         # Train model
         self.model.fit(X_scaled, y)
         self.is_fitted = True
+        
+        # Seed the online statistics, so partial_fit continues from this history
+        self.n_samples_seen = 0
+        self._update_statistics(X, y)
+    
+    def partial_fit(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        feature_names: Optional[list] = None
+    ) -> None:
+        """
+        Update the model with new rows without revisiting earlier ones.
+        
+        The feature and target means and the co-moment matrices X^T X and
+        X^T y (about the means) are merged with those of the new rows using
+        the pairwise update of Chan et al., which stays accurate over long
+        histories. The scaler moments and the coefficients are then re-solved
+        from these statistics in O(p^3), independent of the number of rows seen.
+        The result equals a full refit on all rows passed so far, including
+        the rows of the last train call.
+        
+        Args:
+            X: New feature rows
+            y: New targets, 1D or of shape (n_rows, n_outputs)
+            feature_names: Optional list of feature names
+        """
+        if feature_names is not None:
+            self.feature_names = feature_names
+        
+        if len(X) == 0:
+            return
+        self._update_statistics(X, y)
+        self._solve(multi_output=np.ndim(y) == 2)
+    
+    def _update_statistics(self, X: np.ndarray, y: np.ndarray) -> None:
+        # Merge the means and co-moments of a batch into the running ones
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n_new = len(X)
+        y_2d = y.reshape(n_new, -1)
+        
+        mean_x = X.mean(axis=0)
+        mean_y = y_2d.mean(axis=0)
+        centered_x = X - mean_x
+        comoment_xx = centered_x.T @ centered_x
+        comoment_xy = centered_x.T @ (y_2d - mean_y)
+        
+        if self.n_samples_seen == 0:
+            self._mean_x, self._mean_y = mean_x, mean_y
+            self._comoment_xx, self._comoment_xy = comoment_xx, comoment_xy
+        else:
+            n_old = self.n_samples_seen
+            n_total = n_old + n_new
+            delta_x = mean_x - self._mean_x
+            delta_y = mean_y - self._mean_y
+            weight = n_old * n_new / n_total
+            self._comoment_xx += comoment_xx + weight * np.outer(delta_x, delta_x)
+            self._comoment_xy += comoment_xy + weight * np.outer(delta_x, delta_y)
+            self._mean_x += delta_x * n_new / n_total
+            self._mean_y += delta_y * n_new / n_total
+        self.n_samples_seen += n_new
+    
+    def _solve(self, multi_output: bool) -> None:
+        # Scaler moments as StandardScaler would compute them on all rows seen
+        n_samples = self.n_samples_seen
+        var = np.diag(self._comoment_xx) / n_samples
+        scale = np.sqrt(var)
+        scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0
+        self.scaler.mean_ = self._mean_x.copy()
+        self.scaler.var_ = var
+        self.scaler.scale_ = scale
+        self.scaler.n_samples_seen_ = n_samples
+        self.scaler.n_features_in_ = len(scale)
+        
+        # Normal equations of the centered, scaled problem; lstsq gives the
+        # minimum-norm solution like LinearRegression when features are collinear
+        gram = self._comoment_xx / np.outer(scale, scale)
+        rhs = self._comoment_xy / scale[:, None]
+        coef, _, rank, singular = np.linalg.lstsq(gram, rhs, rcond=None)
+        
+        # Scaled features have zero mean, so the intercept is the target mean
+        self.model.coef_ = coef.T if multi_output else coef[:, 0]
+        self.model.intercept_ = self._mean_y.copy() if multi_output else float(self._mean_y[0])
+        self.model.rank_ = rank
+        self.model.singular_ = np.sqrt(np.abs(singular))
+        self.model.n_features_in_ = len(scale)
+        self.is_fitted = True
     
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
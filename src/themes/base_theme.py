@@ -4,13 +4,16 @@ from typing import Dict, Any, Optional
 import pandas as pd
 import numpy as np
 from ..utils.data_loader import data_loader
+from ..utils.dataset_reader import UPLOAD_EXTENSIONS
 from ..utils.visualizations import ThemeVisualizer
 from ..models.regression import LinearRegressionModel
 from ..models.classification import LogisticRegressionModel
 from ..models.clustering import KMeansModel
+from ..models.backtesting import WalkForwardBacktester
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import traceback
+import uuid
 
 class BaseTheme(ABC):
     def __init__(self, name: str):
@@ -205,6 +208,17 @@ class BaseTheme(ABC):
                 </div>
             """, unsafe_allow_html=True)
     
+    def _prefetch_owner(self) -> str:
+        """
+        Get the key scoping this user session's background prefetches.
+        
+        Returns:
+            Session-wide owner key for DataLoader.prefetch
+        """
+        if 'prefetch_owner' not in st.session_state:
+            st.session_state['prefetch_owner'] = uuid.uuid4().hex
+        return st.session_state['prefetch_owner']
+    
     def get_model(self, model_type: str) -> Any:
         """
         Get a model instance for the theme.
@@ -499,6 +513,20 @@ class BaseTheme(ABC):
                     )
                     st.plotly_chart(fig, use_container_width=True)
             
+            # Out-of-sample check: refit on past samples only and score the following block
+            st.write("Walk-Forward Evaluation:")
+            try:
+                # Fit the folds in this process: spawning workers from a Streamlit
+                # rerun costs more than five fits of the selected data. The folds
+                # refit a fresh model, not the one trained on all rows above
+                backtester = WalkForwardBacktester(self.get_model(analysis_type), n_folds=5, max_workers=1)
+                backtest = backtester.run(X, y if analysis_type != 'clustering' else None)
+                st.dataframe(backtest['folds'])
+                for metric, value in backtest['mean'].items():
+                    st.metric(f"OUT-OF-SAMPLE {metric.upper()}", f"{value:.4f}")
+            except ValueError as e:
+                st.warning(f"Walk-forward evaluation skipped: {str(e)}")
+            
             # After running the analysis and displaying charts, show themed message
             self.display_analysis_results(data, analysis_type, metrics if 'metrics' in locals() else None)
             
@@ -544,6 +572,9 @@ class BaseTheme(ABC):
                     start_dt = pd.Timestamp(start_date)
                     end_dt = pd.Timestamp(end_date)
                     
+                    # Pending prefetches of this session are stale now
+                    data_loader.cancel_prefetch(owner=self._prefetch_owner())
+                    
                     # Load data
                     data = data_loader.load_stock_data(symbol, start_dt, end_dt)
                     
@@ -557,6 +588,9 @@ class BaseTheme(ABC):
                     # Display success message
                     self.display_success(f"Successfully loaded data for {symbol}")
                     
+                    # Warm the cache for the watchlist and neighbouring date ranges
+                    data_loader.prefetch(start_dt, end_dt, symbols=[symbol], owner=self._prefetch_owner())
+                    
                 except Exception as e:
                     self.display_error(f"Error loading stock data: {str(e)}")
             
@@ -583,14 +617,17 @@ class BaseTheme(ABC):
         else:  # Kragle dataset
             uploaded_file = st.sidebar.file_uploader(
                 "Upload Kragle Dataset",
-                type=['csv', 'xlsx'],
+                type=UPLOAD_EXTENSIONS,
+                help="Compressed files must be CSVs named .csv.gz or .csv.zst",
                 key=f"{self.name.lower()}_file_uploader"
             )
             
             if uploaded_file is not None:
                 try:
-                    # Load data
-                    data = data_loader.load_kragle_dataset(uploaded_file)
+                    # Load data, reporting progress while large files are streamed in
+                    progress_bar = st.progress(0.0)
+                    data = data_loader.load_kragle_dataset(uploaded_file, progress_callback=progress_bar.progress)
+                    progress_bar.empty()
                     
                     # Display data
                     self.display_subheader("Kragle Dataset")
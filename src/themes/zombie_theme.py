@@ -4,6 +4,7 @@ import os
 import streamlit as st
 import pandas as pd
 from ..utils.data_loader import data_loader
+from ..utils.dataset_reader import UPLOAD_EXTENSIONS
 from src.utils.visualizations import ThemeVisualizer
 
 class ZombieTheme(BaseTheme):
@@ -352,6 +353,9 @@ class ZombieTheme(BaseTheme):
                     start_dt = pd.Timestamp(start_date)
                     end_dt = pd.Timestamp(end_date)
                     
+                    # Pending prefetches of this session are stale now
+                    data_loader.cancel_prefetch(owner=self._prefetch_owner())
+                    
                     # Load data
                     data = data_loader.load_stock_data(symbol, start_dt, end_dt)
                     
@@ -365,6 +369,9 @@ class ZombieTheme(BaseTheme):
                     # Display success message
                     self.display_success(f"Successfully loaded data for {symbol}")
                     
+                    # Warm the cache for the watchlist and neighbouring date ranges
+                    data_loader.prefetch(start_dt, end_dt, symbols=[symbol], owner=self._prefetch_owner())
+                    
                 except Exception as e:
                     self.display_error(f"Error loading stock data: {str(e)}")
             
@@ -429,14 +436,17 @@ class ZombieTheme(BaseTheme):
         else:  # Kragle dataset
             uploaded_file = st.sidebar.file_uploader(
                 "Upload Kragle Dataset",
-                type=['csv', 'xlsx'],
+                type=UPLOAD_EXTENSIONS,
+                help="Compressed files must be CSVs named .csv.gz or .csv.zst",
                 key=f"{self.name.lower()}_file_uploader"
             )
             
             if uploaded_file is not None:
                 try:
-                    # Load data
-                    data = data_loader.load_kragle_dataset(uploaded_file)
+                    # Load data, reporting progress while large files are streamed in
+                    progress_bar = st.progress(0.0)
+                    data = data_loader.load_kragle_dataset(uploaded_file, progress_callback=progress_bar.progress)
+                    progress_bar.empty()
                     
                     # Store data in session state
                     st.session_state['stock_data'] = data
@@ -1,12 +1,352 @@
+import os
+import threading
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any, List, Union, Callable, Sequence, Iterator
+from .dataset_reader import DEFAULT_CHUNK_ROWS, iter_dataset_chunks, open_memory_mapped, read_dataset
+from .feature_windows import build_windows, horizon_targets
+from .frame_cache import FrameCache, estimate_nbytes, frame_fingerprint, freeze_frame
+from .prefetcher import DownloadGate, Prefetcher
+from .indicators import IndicatorState, compute_indicators, compute_panel_indicators, indicator_names
+from .labeling import label_matrix, price_movement_classes
+from .ohlcv_store import OHLCVStore, normalize_date, merge_intervals, subtract_intervals
+from .visualization_bundle import VisualizationBundle
+
+# yfinance collects the results and errors of every download in module-level
+# dicts that each call resets, so concurrent calls (e.g. from the prefetcher)
+# can lose each other's data and report it as empty; downloads run one at a
+# time, foreground ones before queued prefetches
+_yf_download_gate = DownloadGate()
 
 class DataLoader:
-    def __init__(self):
-        self.cache = {}  # Simple cache for storing downloaded data
+    # Empty downloads longer than this are treated as failures rather than
+    # weekends/holidays, so their range is not recorded as covered
+    MAX_EMPTY_GAP_DAYS = 4
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: Optional[int] = 256 * 1024 ** 2,
+        cache_ttl: Optional[float] = None,
+        copy_on_read: bool = False,
+        watchlist: Optional[List[str]] = None,
+        prefetch_workers: int = 4,
+        result_cache_max_bytes: Optional[int] = 128 * 1024 ** 2
+    ):
+        """
+        Initialize the data loader.
+        
+        Args:
+            cache_dir: Directory for the persistent OHLCV store (if None, only the in-memory cache is used)
+            cache_max_bytes: Memory budget of the in-memory cache in bytes (if None, unbounded)
+            cache_ttl: Seconds after which in-memory entries expire (if None, entries never expire)
+            copy_on_read: Whether load_stock_data returns private copies instead of read-only views of the cache
+            watchlist: Symbols that are always prefetched in the background
+            prefetch_workers: Maximum number of concurrent background prefetch tasks
+            result_cache_max_bytes: Memory budget in bytes for memoized indicator and visualization results
+        """
+        # Per-symbol LRU cache: {'data': DataFrame, 'intervals': covered date intervals}
+        self.cache = FrameCache(max_bytes=cache_max_bytes, ttl=cache_ttl)
+        self.store = OHLCVStore(cache_dir) if cache_dir else None
+        # Derived results keyed by a content hash of their input frame, shared across reruns and sessions
+        self.result_cache = FrameCache(max_bytes=result_cache_max_bytes)
+        # Inferred dataset schemas keyed by file fingerprint
+        self.schema_cache = FrameCache(max_bytes=1024 ** 2)
+        self.copy_on_read = copy_on_read
+        self.watchlist = list(watchlist or [])
+        self.prefetcher = Prefetcher(self, max_workers=prefetch_workers)
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._symbol_locks_guard = threading.Lock()
+        # Memory-mapped local datasets: (path, columns) -> (modification time, frame)
+        self._mapped_datasets: Dict[tuple, Tuple[float, pd.DataFrame]] = {}
+        self._mapped_datasets_guard = threading.Lock()
+    
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        """
+        Get the lock serializing cache updates of a symbol across threads.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Lock for the symbol
+        """
+        with self._symbol_locks_guard:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+    
+    def prefetch(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        symbols: Optional[List[str]] = None,
+        adjacent_windows: int = 1,
+        owner: Any = None
+    ) -> None:
+        """
+        Warm the cache in the background for the watchlist and adjacent date windows.
+        
+        Returns immediately. Each window is fetched with one batched download
+        of all symbols, and failures are recorded per symbol in
+        prefetcher.errors. Background downloads yield to foreground loads.
+        
+        Args:
+            start_date: Start of the date window currently shown
+            end_date: End of the date window currently shown
+            symbols: Extra symbols to prefetch along with the watchlist
+            adjacent_windows: Number of same-length windows to prefetch before and after
+            owner: Hashable key of the caller, e.g. one per user session; a new
+                prefetch only cancels the pending one of the same owner
+        """
+        self.prefetcher.prefetch(
+            list(symbols or []) + self.watchlist,
+            start_date,
+            end_date,
+            adjacent_windows=adjacent_windows,
+            owner=owner
+        )
+    
+    def cancel_prefetch(self, owner: Any = None) -> None:
+        """
+        Cancel an owner's pending background prefetch tasks.
+        
+        Args:
+            owner: Key passed to prefetch
+        """
+        self.prefetcher.cancel(owner)
+    
+    @staticmethod
+    def _as_float32(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast numeric columns to float32, skipping columns that already are.
+        
+        Args:
+            df: DataFrame to modify in place (usually a shallow copy)
+            
+        Returns:
+            The same DataFrame
+        """
+        for col in df.select_dtypes(include=[np.number]).columns:
+            if df[col].dtype != np.float32:
+                df[col] = df[col].astype('float32')
+        return df
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss/eviction counters and memory usage of the in-memory cache.
+        
+        Returns:
+            Dictionary of cache statistics
+        """
+        return self.cache.stats()
+    
+    def result_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss/eviction counters and memory usage of the memoized results.
+        
+        Returns:
+            Dictionary of cache statistics
+        """
+        return self.result_cache.stats()
+    
+    @staticmethod
+    def _normalize_download(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize a single-symbol Yahoo Finance frame.
+        
+        Args:
+            data: Raw downloaded frame
+            
+        Returns:
+            DataFrame indexed by date with float32 columns (may be empty)
+        """
+        if data.empty:
+            return data
+        
+        # Newer yfinance versions return (Price, Ticker) columns even for one symbol
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+        
+        # Ensure index is datetime and sorted
+        data.index = pd.to_datetime(data.index)
+        data.index.name = 'Date'
+        data = data.sort_index()
+        
+        # Convert numeric columns to float32
+        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        for col in numeric_cols:
+            data[col] = pd.to_numeric(data[col], errors='coerce').astype('float32')
+        
+        return data
+    
+    def _download(self, symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Download and normalize stock data from Yahoo Finance.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            start_date: Start date for data
+            end_date: End date for data (exclusive)
+            
+        Returns:
+            DataFrame indexed by date with float32 columns (may be empty)
+        """
+        with _yf_download_gate.hold():
+            data = yf.download(symbol, start=start_date, end=end_date, progress=False)
+        return self._normalize_download(data)
+    
+    def _download_many(self, symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """
+        Download several symbols in one batched Yahoo Finance request.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for data
+            end_date: End date for data (exclusive)
+            
+        Returns:
+            Dictionary of normalized per-symbol frames (empty frames for symbols without data)
+        """
+        # yfinance parallelizes the tickers of one batch internally
+        with _yf_download_gate.hold():
+            raw = yf.download(symbols, start=start_date, end=end_date, group_by='ticker', progress=False, threads=True)
+        
+        frames = {}
+        tickers = raw.columns.get_level_values(0) if isinstance(raw.columns, pd.MultiIndex) else []
+        for symbol in symbols:
+            if symbol in tickers:
+                # Batched frames share one date index, so drop rows this symbol has no data for
+                frame = raw[symbol].dropna(how='all')
+            elif len(symbols) == 1 and not raw.empty:
+                frame = raw
+            else:
+                frame = pd.DataFrame()
+            frames[symbol] = self._normalize_download(frame.copy())
+        return frames
+    
+    def _load_from_store(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        force_refresh: bool = False
+    ) -> pd.DataFrame:
+        """
+        Serve a date range from the persistent store, downloading only missing gaps.
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start date for data
+            end_date: End date for data
+            force_refresh: Whether to re-download the whole range
+            
+        Returns:
+            DataFrame containing stock data for the range
+        """
+        start, end = normalize_date(start_date), normalize_date(end_date)
+        if force_refresh:
+            gaps = [(start, end)]
+        else:
+            gaps = self.store.missing_intervals(symbol, start, end)
+        
+        for gap_start, gap_end in gaps:
+            frame = self._download(symbol, gap_start, gap_end)
+            # An empty short gap is most likely a weekend or holiday, but it may also
+            # be a failed download; only the in-memory cache records it as covered,
+            # so a wrong guess does not outlive the session
+            if not frame.empty:
+                self.store.write(symbol, frame, gap_start, self._covered_end(frame, gap_start, gap_end))
+        
+        return self.store.read(symbol, start, end)
+    
+    def _covered_end(self, frame: pd.DataFrame, gap_start: pd.Timestamp, gap_end: pd.Timestamp) -> pd.Timestamp:
+        """
+        Get the end of the range a fetched gap may be recorded as covering.
+        
+        Args:
+            frame: Rows fetched for the gap
+            gap_start: Start of the gap
+            gap_end: End of the gap (exclusive)
+            
+        Returns:
+            End of the covered range (equal to gap_start if nothing is covered)
+        """
+        if frame.empty and (gap_end - gap_start).days > self.MAX_EMPTY_GAP_DAYS:
+            # yfinance reports failures as empty frames; retry next time
+            return gap_start
+        # Today's bar is still forming, so coverage never extends past today
+        return max(gap_start, min(gap_end, normalize_date(datetime.now())))
+    
+    def _fetch_range(
+        self,
+        symbol: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        force_refresh: bool = False
+    ) -> pd.DataFrame:
+        """
+        Fetch a date range from the persistent store if configured, otherwise from Yahoo Finance.
+        
+        Args:
+            symbol: Stock symbol
+            start: Start of the range
+            end: End of the range (exclusive)
+            force_refresh: Whether to bypass the persistent store
+            
+        Returns:
+            DataFrame containing stock data for the range (may be empty)
+        """
+        if self.store is not None:
+            return self._load_from_store(symbol, start, end, force_refresh)
+        return self._download(symbol, start, end)
+    
+    def _merge_into_cache(
+        self,
+        symbol: str,
+        entry: Dict[str, Any],
+        fetched: List[Tuple[pd.Timestamp, pd.Timestamp, pd.DataFrame]]
+    ) -> Dict[str, Any]:
+        """
+        Coalesce fetched segments with a symbol's cached rows and store the result.
+        
+        Args:
+            symbol: Stock symbol
+            entry: Current cache entry of the symbol
+            fetched: List of (start, end, frame) segments that were fetched
+            
+        Returns:
+            The new cache entry
+        """
+        frames = [entry['data']] if not entry['data'].empty else []
+        intervals = list(entry['intervals'])
+        for gap_start, gap_end, frame in fetched:
+            if not frame.empty:
+                frames.append(frame)
+            intervals.append((gap_start, self._covered_end(frame, gap_start, gap_end)))
+        
+        merged = pd.concat(frames) if frames else pd.DataFrame()
+        if not merged.empty:
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        entry = {'data': freeze_frame(merged), 'intervals': merge_intervals(intervals)}
+        self.cache.put(symbol, entry)
+        return entry
+    
+    @staticmethod
+    def _slice_range(data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """
+        Slice the rows of a sorted, date-indexed frame.
+        
+        Args:
+            data: DataFrame sorted by its DatetimeIndex
+            start: Start of the range
+            end: End of the range (exclusive)
+            
+        Returns:
+            Rows within [start, end)
+        """
+        lo, hi = data.index.searchsorted(start), data.index.searchsorted(end)
+        return data.iloc[lo:hi]
     
     def load_stock_data(
         self,
@@ -18,6 +358,16 @@ class DataLoader:
         """
         Load stock data from Yahoo Finance with caching.
         
+        The in-memory cache keeps one frame per symbol together with the date
+        intervals it covers, so any contained range is answered by slicing and
+        partially overlapping ranges only fetch the uncovered segments. When a
+        persistent store is configured, those segments are served from disk and
+        only gaps missing there too are downloaded.
+        
+        Unless copy_on_read is set, the returned frame is a read-only view of the
+        cache: in-place writes raise (or copy under pandas copy-on-write), while
+        adding or replacing columns on a shallow copy is safe.
+        
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
             start_date: Start date for data
@@ -27,37 +377,108 @@ class DataLoader:
         Returns:
             DataFrame containing stock data
         """
-        cache_key = f"{symbol}_{start_date.date()}_{end_date.date()}"
-        
-        if not force_refresh and cache_key in self.cache:
-            return self.cache[cache_key].copy()
+        start, end = normalize_date(start_date), normalize_date(end_date)
         
         try:
-            # Download data and ensure index is datetime
-            data = yf.download(symbol, start=start_date, end=end_date)
+            with self._symbol_lock(symbol):
+                if force_refresh:
+                    self.cache.pop(symbol, None)
+                
+                entry = self.cache.peek(symbol, {'data': pd.DataFrame(), 'intervals': []})
+                gaps = subtract_intervals(start, end, entry['intervals'])
+                
+                if not gaps:
+                    # Refresh the symbol's recency and count the hit
+                    self.cache.get(symbol)
+                else:
+                    self.cache.record_miss()
+                    
+                    # Fetch only the uncovered segments and coalesce them with cached rows
+                    fetched = [
+                        (gap_start, gap_end, self._fetch_range(symbol, gap_start, gap_end, force_refresh))
+                        for gap_start, gap_end in gaps
+                    ]
+                    entry = self._merge_into_cache(symbol, entry, fetched)
+            
+            data = self._slice_range(entry['data'], start, end) if not entry['data'].empty else entry['data']
             if data.empty:
                 raise ValueError(f"No data found for symbol {symbol}")
             
-            # Ensure index is datetime and sorted
-            data.index = pd.to_datetime(data.index)
-            data = data.sort_index()
+            return data.copy() if self.copy_on_read else data
             
-            # Reset index to ensure clean state
-            data = data.reset_index()
-            data['Date'] = pd.to_datetime(data['Date'])
-            data = data.set_index('Date')
+        except Exception as e:
+            raise Exception(f"Error downloading data for {symbol}: {str(e)}")
+    
+    def load_many(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        force_refresh: bool = False,
+        as_panel: bool = False
+    ) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+        """
+        Load stock data for a whole watchlist with a single batched download.
+        
+        Symbols already covered by the in-memory cache or the persistent store are
+        served from there; all others are fetched together in one multi-ticker
+        request, split per symbol and cached. Symbols without any data are left
+        out of the result.
+        
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            start_date: Start date for data
+            end_date: End date for data
+            force_refresh: Whether to force refresh the data from Yahoo Finance
+            as_panel: Whether to return one long-format frame indexed by (Symbol, Date)
+            
+        Returns:
+            Dictionary of per-symbol DataFrames, or a long-format panel
+        """
+        start, end = normalize_date(start_date), normalize_date(end_date)
+        symbols = list(dict.fromkeys(symbols))
+        
+        try:
+            to_download = []
+            for symbol in symbols:
+                if force_refresh:
+                    self.cache.pop(symbol, None)
+                entry = self.cache.peek(symbol, {'data': pd.DataFrame(), 'intervals': []})
+                gaps = subtract_intervals(start, end, entry['intervals'])
+                if gaps and (self.store is None or force_refresh or self.store.missing_intervals(symbol, start, end)):
+                    to_download.append(symbol)
             
-            # Convert numeric columns to float32
-            numeric_cols = data.select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                data[col] = pd.to_numeric(data[col], errors='coerce').astype('float32')
+            failed = set()
+            if to_download:
+                batch = self._download_many(to_download, start, end)
+                for symbol in to_download:
+                    frame = batch[symbol]
+                    if frame.empty:
+                        failed.add(symbol)
+                        continue
+                    with self._symbol_lock(symbol):
+                        if self.store is not None:
+                            self.store.write(symbol, frame, start, self._covered_end(frame, start, end))
+                        self.cache.record_miss()
+                        entry = self.cache.peek(symbol, {'data': pd.DataFrame(), 'intervals': []})
+                        self._merge_into_cache(symbol, entry, [(start, end, frame)])
             
-            # Cache the processed data
-            self.cache[cache_key] = data.copy()
-            return data
+            # Everything left is now served from the cache or the store
+            results = {}
+            for symbol in symbols:
+                if symbol in failed:
+                    continue
+                results[symbol] = self.load_stock_data(symbol, start, end)
             
         except Exception as e:
-            raise Exception(f"Error downloading data for {symbol}: {str(e)}")
+            raise Exception(f"Error downloading data for {', '.join(symbols)}: {str(e)}")
+        
+        if not results:
+            raise ValueError(f"No data found for symbols {', '.join(symbols)}")
+        
+        if as_panel:
+            return pd.concat(results, names=['Symbol'])
+        return results
     
     def _create_price_movement_classes(self, prices: np.ndarray, threshold: float = 0.01) -> np.ndarray:
         """
@@ -70,77 +491,100 @@ class DataLoader:
         Returns:
             Array of class labels (0: down, 1: stable, 2: up)
         """
-        # Calculate percentage changes
-        pct_change = np.diff(prices) / prices[:-1]
-        
-        # Create classes based on threshold
-        classes = np.zeros(len(prices))
-        classes[1:] = np.where(pct_change > threshold, 2,  # Up
-                     np.where(pct_change < -threshold, 0,  # Down
-                     1))  # Stable
-        
-        return classes
+        return price_movement_classes(prices, threshold).astype(np.float64)
 
     def prepare_ml_data(
         self,
         data: pd.DataFrame,
         target_column: str = 'Close',
         feature_columns: Optional[list] = None,
-        prediction_days: int = 1,
-        analysis_type: str = 'regression'
-    ) -> Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]:
+        prediction_days: Union[int, List[int]] = 1,
+        analysis_type: str = 'regression',
+        return_mask: bool = False
+    ) -> Union[
+        Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex],
+        Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex, np.ndarray]
+    ]:
         """
         Prepare data for machine learning models.
         
+        X and y are built directly as contiguous float32 arrays from the column
+        buffers: one boolean mask marks the rows whose features and shifted
+        target are all present, and each column is copied once into a
+        preallocated X. No intermediate frames are created.
+        
+        Passing a list of horizons gathers the target at every horizon in the
+        same pass and returns a 2D target matrix with one column per horizon.
+        The rows share one validity mask, so every column lines up with X and
+        multi-output models can be trained in a single fit.
+        
         Args:
             data: DataFrame containing stock data
             target_column: Column to use as target variable
             feature_columns: Columns to use as features (if None, uses all numeric columns)
-            prediction_days: Number of days to predict ahead
+            prediction_days: Number of days to predict ahead, or a list of horizons
             analysis_type: Type of analysis ('regression', 'classification', or 'clustering')
+            return_mask: Whether to also return the validity mask over the date-sorted input rows
             
         Returns:
-            Tuple of (X, y, dates) for machine learning, where dates is the index of valid samples
+            Tuple of (X, y, dates) for machine learning, where dates is the index of valid samples;
+            y has shape (n_samples, len(prediction_days)) when a list of horizons is given.
+            With return_mask, the boolean mask of the kept rows is appended to the tuple.
         """
-        # Ensure we're working with a copy and the index is datetime
-        df = data.copy()
+        multi_horizon = not isinstance(prediction_days, (int, np.integer))
+        horizons = list(prediction_days) if multi_horizon else [prediction_days]
+        if not horizons or min(horizons) < 1:
+            raise ValueError(f"Prediction horizons must be positive, got {prediction_days}")
+        
+        df = data
         if not isinstance(df.index, pd.DatetimeIndex):
+            df = df.copy(deep=False)
             df.index = pd.to_datetime(df.index)
-        df = df.sort_index()
-        
-        # Convert numeric columns to float32
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         
         if feature_columns is None:
             # Exclude target column from features if it's not explicitly included
             feature_columns = [col for col in df.select_dtypes(include=[np.number]).columns 
                              if col != target_column]
         
-        # Create target variable (shifted by prediction_days)
-        shifted_target = df[target_column].shift(-prediction_days)
-        # Ensure shifted_target is a Series (1D)
-        if isinstance(shifted_target, pd.DataFrame):
-            shifted_target = shifted_target.iloc[:, 0]
-        y = pd.Series(shifted_target, name=target_column, index=df.index)
+        # Column buffers as float32 views (cast only where the frame is not float32 yet)
+        features = [df[col].to_numpy(dtype=np.float32) for col in feature_columns]
+        target = df[target_column]
+        # Duplicate column names return a frame; use the first column
+        if isinstance(target, pd.DataFrame):
+            target = target.iloc[:, 0]
+        target = target.to_numpy(dtype=np.float32)
+        
+        # Row i is valid if all its features and its target at every horizon are present
+        n_rows = len(df)
+        n_samples = max(n_rows - max(horizons), 0)
+        Y = horizon_targets(target, horizons, 0, n_samples)
+        valid = ~np.isnan(Y).any(axis=1)
+        for values in features:
+            valid &= ~np.isnan(values[:n_samples])
         
-        # Create features matrix
-        X = df[feature_columns].copy()
+        # Fully valid data (the usual case after indicator gap filling) needs no fancy indexing
+        rows = slice(0, n_samples) if valid.all() else np.flatnonzero(valid)
+        n_valid = n_samples if isinstance(rows, slice) else len(rows)
         
-        # Drop rows with NaN values
-        valid_data = pd.concat([X, y.to_frame()], axis=1).dropna()
+        # Preallocated C-contiguous design matrix, filled one column at a time
         
-        # Get the valid dates
-        valid_dates = valid_data.index
+        X_array = np.empty((n_valid, len(features)), dtype=np.float32)
+        for j, values in enumerate(features):
+            X_array[:, j] = values[rows]
         
-        # Convert to numpy arrays
-        X_array = valid_data[feature_columns].values.astype('float32')
-        y_array = valid_data[target_column].values.astype('float32')
+        y_array = Y[rows] if multi_horizon else np.ascontiguousarray(Y[rows, 0])
+        valid_dates = df.index[rows]
         
         # Process target variable based on analysis type
         if analysis_type == 'classification':
-            y_array = self._create_price_movement_classes(y_array)
+            if multi_horizon:
+                y_array = np.column_stack([
+                    self._create_price_movement_classes(y_array[:, k]) for k in range(len(horizons))
+                ])
+            else:
+                y_array = self._create_price_movement_classes(y_array)
         elif analysis_type == 'clustering':
             # For clustering, we don't need a target variable
             y_array = None
@@ -149,147 +593,461 @@ class DataLoader:
         if analysis_type != 'clustering' and X_array.shape[0] != y_array.shape[0]:
             raise ValueError(f"Feature and target shapes don't match: X={X_array.shape}, y={y_array.shape}")
         
+        if return_mask:
+            mask = np.zeros(n_rows, dtype=bool)
+            mask[:n_samples] = valid
+            return X_array, y_array, valid_dates, mask
         return X_array, y_array, valid_dates
     
-    def calculate_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+    def prepare_window_data(
+        self,
+        data: pd.DataFrame,
+        window: int,
+        horizons: Union[int, List[int]] = 1,
+        target_column: str = 'Close',
+        feature_columns: Optional[list] = None,
+        flatten: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]:
         """
-        Calculate common technical indicators for the stock data.
+        Prepare lagged-window samples for models trained on N-day history.
+        
+        The features are copied once into a contiguous float32 matrix, and X
+        is a sliding-window view of it, so the window length does not
+        multiply memory the way hand-built lag columns do.
         
         Args:
             data: DataFrame containing stock data
+            window: Number of consecutive days per sample
+            horizons: Days ahead to predict, one target column per horizon
+            target_column: Column to use as target variable
+            feature_columns: Columns to use as features (if None, uses all numeric columns)
+            flatten: Whether to return X as (n_samples, window * n_features) for 2D models
+                (this copies the windows)
+            
+        Returns:
+            Tuple of (X of shape (n_samples, window, n_features), Y of shape
+            (n_samples, n_horizons), dates of each window's last day)
+        """
+        df = data
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df = df.copy(deep=False)
+            df.index = pd.to_datetime(df.index)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        
+        if feature_columns is None:
+            feature_columns = [col for col in df.select_dtypes(include=[np.number]).columns 
+                             if col != target_column]
+        horizons = [horizons] if isinstance(horizons, int) else list(horizons)
+        
+        features = np.empty((len(df), len(feature_columns)), dtype=np.float32)
+        for j, col in enumerate(feature_columns):
+            features[:, j] = df[col].to_numpy(dtype=np.float32)
+        target = df[target_column]
+        if isinstance(target, pd.DataFrame):
+            target = target.iloc[:, 0]
+        
+        X, Y, rows = build_windows(
+            features,
+            target.to_numpy(dtype=np.float32),
+            window,
+            horizons=horizons,
+            flatten=flatten
+        )
+        return X, Y, df.index[rows]
+    
+    def create_labels(
+        self,
+        data: pd.DataFrame,
+        thresholds: Sequence[float] = (0.01,),
+        atr_multipliers: Sequence[float] = (),
+        barriers: Sequence[Tuple[float, float, int]] = (),
+        horizon: int = 1,
+        scale_barriers: bool = False
+    ) -> pd.DataFrame:
+        """
+        Compute classification labels for a grid of label definitions at once.
+        
+        Fixed return thresholds, ATR-scaled thresholds and triple-barrier
+        settings are all labelled in one vectorized pass (see utils.labeling)
+        into a compact int8 matrix, so experiments across label definitions
+        share one pass over the data. Results are memoized on a content hash
+        of the input and the label settings.
+        
+        Args:
+            data: DataFrame containing stock data
+            thresholds: Fixed return thresholds, one label column each
+            atr_multipliers: Multiples of the relative ATR, one label column each
+            barriers: (upper, lower, max_holding) triple-barrier settings, one label column each
+            horizon: Days ahead for the threshold and ATR labels
+            scale_barriers: Whether barrier widths are ATR multiples instead of price fractions
+            
+        Returns:
+            DataFrame of int8 labels (0: down, 1: stable, 2: up, -1: unknown), indexed by date
+        """
+        params = (tuple(thresholds), tuple(atr_multipliers), tuple(map(tuple, barriers)), horizon, scale_barriers)
+        key = ('labels', frame_fingerprint(data, params))
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached.copy(deep=False)
+        
+        df = data
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df = df.copy(deep=False)
+            df.index = pd.to_datetime(df.index)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        
+        labels = label_matrix(
+            df,
+            thresholds=thresholds,
+            atr_multipliers=atr_multipliers,
+            barriers=barriers,
+            horizon=horizon,
+            scale_barriers=scale_barriers
+        )
+        self.result_cache.put(key, labels)
+        return labels.copy(deep=False)
+
+    def calculate_technical_indicators(
+        self,
+        data: pd.DataFrame,
+        state: Optional[IndicatorState] = None,
+        indicators: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate common technical indicators for the stock data.
+        
+        Indicators come from the registry in utils.indicators; only the ones
+        requested and the intermediates they depend on are computed.
+        
+        When an IndicatorState is passed and the data only appends new bars to
+        the data of the previous call with that state, only the appended tail is
+        computed from the carried-over rolling windows, EMA values and OBV total.
+        
+        A panel of many symbols, either indexed by (Symbol, Date) or in long
+        format with a 'Symbol' column, is computed group-wise in one sweep.
+        
+        Without a state, single-symbol results are memoized on a content hash
+        of the raw columns and returned as read-only frames, so recomputing
+        the same data (e.g. on a rerun) is a lookup.
+        
+        Args:
+            data: DataFrame containing stock data for one symbol, or a panel of symbols
+            state: Optional state carried between calls for incremental updates (single symbol only)
+            indicators: Names of the indicators to compute (if None, all registered indicators)
             
         Returns:
             DataFrame with additional technical indicators
         """
-        # Ensure we're working with a copy and the index is datetime
-        df = data.copy()
+        if indicators is None:
+            indicators = indicator_names()
+        
+        if isinstance(data.index, pd.MultiIndex) or 'Symbol' in data.columns:
+            if state is not None:
+                raise ValueError("Incremental indicator updates are not supported for panels")
+            return self._calculate_panel_indicators(data, indicators)
+        
+        # Work on a shallow copy so the caller's (possibly read-only) frame is never modified
+        df = data.copy(deep=False)
         if not isinstance(df.index, pd.DatetimeIndex):
             df.index = pd.to_datetime(df.index)
-        df = df.sort_index()
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         
         # Ensure numeric columns are float32 instead of float64 for better PyArrow compatibility
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df[col] = df[col].astype('float32')
-        
-        # Simple Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean().astype('float32')
-        df['SMA_50'] = df['Close'].rolling(window=50).mean().astype('float32')
-        
-        # Exponential Moving Averages
-        df['EMA_20'] = df['Close'].ewm(span=20, adjust=False).mean().astype('float32')
-        df['EMA_50'] = df['Close'].ewm(span=50, adjust=False).mean().astype('float32')
-        
-        # Relative Strength Index (RSI)
-        delta = df['Close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        # Calculate average gain and loss
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        df['RSI'] = (100 - (100 / (1 + rs))).astype('float32')
-        
-        # Moving Average Convergence Divergence (MACD)
-        # Calculate the 12 and 26 day EMAs
-        ema12 = df['Close'].ewm(span=12, adjust=False).mean()
-        ema26 = df['Close'].ewm(span=26, adjust=False).mean()
-        
-        # Calculate MACD line
-        df['MACD'] = (ema12 - ema26).astype('float32')
-        
-        # Calculate Signal line (9-day EMA of MACD)
-        df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean().astype('float32')
-        
-        # Bollinger Bands
-        close_series = df['Close']
-        bb_window = 20
-        bb_middle = close_series.rolling(window=bb_window).mean()
-        bb_std = close_series.rolling(window=bb_window).std()
-        
-        # Calculate bands using Series operations
-        df['BB_Middle'] = bb_middle.astype('float32')
-        df['BB_Upper'] = (bb_middle + (2.0 * bb_std)).astype('float32')
-        df['BB_Lower'] = (bb_middle - (2.0 * bb_std)).astype('float32')
-        
-        # Additional indicators
-        # Average True Range (ATR)
-        high_low = df['High'] - df['Low']
-        high_close = np.abs(df['High'] - df['Close'].shift())
-        low_close = np.abs(df['Low'] - df['Close'].shift())
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        df['ATR'] = true_range.rolling(window=14).mean().astype('float32')
-        
-        # On-Balance Volume (OBV)
-        df['OBV'] = (np.sign(df['Close'].diff()) * df['Volume']).fillna(0).cumsum().astype('float32')
-        
-        # Clean up NaN values using bfill and ffill
-        df = df.bfill().ffill()
-        
-        # Ensure all numeric columns are float32
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df[col] = df[col].astype('float32')
+        df = self._as_float32(df)
+        
+        # Indicators are recomputed from the raw columns only
+        registered = set(indicator_names())
+        raw = df[[col for col in df.columns if col not in registered]]
+        
+        if state is not None and state.can_extend(raw, indicators):
+            return self._extend_technical_indicators(raw, state)
+        
+        if state is None:
+            key = ('indicators', frame_fingerprint(raw, indicators))
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                # Shallow copies share the read-only buffers; adding or replacing
+                # columns on them never reaches the cached frame
+                return cached.copy(deep=False)
+        
+        # Indicators come back as one float32 block with gaps already filled like bfill().ffill()
+        values, seeds = compute_indicators(raw, indicators, fill_nans=True)
+        
+        # Clean up NaN values in the raw columns using bfill and ffill; the state
+        # keeps the unfilled rows so it can tell gaps from real values
+        filled = raw.bfill().ffill() if raw.isna().values.any() else raw
+        
+        df = pd.concat([filled, values], axis=1)
+        
+        if state is not None:
+            state.update(df, raw, indicators, seeds)
+        else:
+            # Only read-only results can be shared between callers
+            frozen = freeze_frame(df)
+            if frozen is not df:
+                self.result_cache.put(key, frozen)
+                frozen = frozen.copy(deep=False)
+            df = frozen
         
         return df
     
-    def load_kragle_dataset(self, file_path: str) -> pd.DataFrame:
+    def _calculate_panel_indicators(self, data: pd.DataFrame, indicators: List[str]) -> pd.DataFrame:
         """
-        Load a dataset from Kragle.
+        Calculate technical indicators for a multi-symbol panel.
         
         Args:
-            file_path: Path to the Kragle dataset file
+            data: Panel indexed by (Symbol, Date), or long format with a 'Symbol' column
+            indicators: Names of the indicators to compute
             
         Returns:
-            DataFrame containing the dataset
+            Panel with additional technical indicators, in the same layout as the input
         """
-        try:
-            # Add support for different file formats
-            if file_path.endswith('.csv'):
-                data = pd.read_csv(file_path)
-            elif file_path.endswith('.xlsx'):
-                data = pd.read_excel(file_path)
-            else:
-                raise ValueError("Unsupported file format. Please use .csv or .xlsx files.")
+        long_format = not isinstance(data.index, pd.MultiIndex)
+        df = data.copy(deep=False)
+        if long_format:
+            if not isinstance(df.index, pd.DatetimeIndex):
+                df.index = pd.to_datetime(df.index)
+            df.index.name = df.index.name or 'Date'
+            df = df.set_index('Symbol', append=True).swaplevel(0, 1)
+        
+        # Group rows by symbol and sort by date within each symbol; sorting the
+        # integer level codes avoids slow comparisons of the symbol labels
+        dates = pd.to_datetime(df.index.get_level_values(1))
+        order = np.lexsort((dates.asi8, df.index.codes[0]))
+        if (order != np.arange(len(order))).any():
+            df = df.iloc[order]
+        
+        df = self._as_float32(df)
+        registered = set(indicator_names())
+        raw = df[[col for col in df.columns if col not in registered]]
+        
+        values = compute_panel_indicators(raw, indicators)
+        
+        # Clean up NaN values in the raw columns per symbol
+        if raw.isna().values.any():
+            grouped = raw.groupby(level=0)
+            raw = grouped.bfill().groupby(level=0).ffill()
+        
+        df = pd.concat([raw, values], axis=1)
+        if long_format:
+            df = df.reset_index(level=0)
+        return df
+    
+    def _extend_technical_indicators(self, raw: pd.DataFrame, state: IndicatorState) -> pd.DataFrame:
+        """
+        Compute indicators for the bars appended since the previous call only.
+        
+        The new rows are appended to a buffer kept by the state, so the
+        history is not copied. Preparing the input (sorting check, float32
+        cast of non-float32 columns) still touches every row; pass float32
+        input for updates whose cost does not grow with the history.
+        
+        Args:
+            raw: Sorted float32 input frame without indicator columns
+            state: State of the previous call, updated in place
             
-            # Convert numeric columns to float32
-            numeric_cols = data.select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                data[col] = pd.to_numeric(data[col], errors='coerce').astype('float32')
+        Returns:
+            Previous result extended with the new bars
+        """
+        new_rows = raw.iloc[len(state.result):]
+        if new_rows.empty:
+            return state.result.copy(deep=False)
+        
+        # The stored tail provides the lookback for the rolling windows
+        window = pd.concat([state.tail, new_rows])
+        values, seeds = compute_indicators(
+            window,
+            state.indicators,
+            start=len(state.tail),
+            seeds=state.seeds
+        )
+        
+        tail = pd.concat([new_rows, values], axis=1)
+        
+        # Fill gaps in the new bars from the last known row
+        if tail.isna().values.any():
+            tail = pd.concat([state.result.iloc[-1:], tail]).ffill().iloc[1:]
+        
+        return state.append(tail, window, seeds).copy(deep=False)
+    
+    def load_local_dataset(
+        self,
+        path: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Open a local Feather/Arrow or .npy OHLCV file through memory mapping.
+        
+        The returned frame views the mapped file instead of holding a private
+        copy, so multi-year datasets never have to fit in RAM and sessions on
+        one host share the OS page cache. The mapping is opened once per file
+        and reused until the file changes; date ranges are row slices of it.
+        prepare_ml_data and calculate_technical_indicators accept these
+        read-only views directly (store prices as float32 to avoid a cast).
+        
+        Args:
+            path: Path to a .feather, .arrow or .npy file
+            start_date: Start of the date range (if None, from the first row)
+            end_date: End of the date range, exclusive (if None, to the last row)
+            columns: Columns to expose (for 2D .npy arrays, the names of all array columns)
             
-            # Convert date columns to datetime if they exist
-            date_cols = data.select_dtypes(include=['object']).columns
-            for col in date_cols:
-                try:
-                    data[col] = pd.to_datetime(data[col])
-                except:
-                    continue
+        Returns:
+            Read-only DataFrame indexed by date; files without a Date column
+            (such as 2D .npy arrays) keep a row-number index
             
-            return data
+        Raises:
+            ValueError: If a date range is requested from a file without dates
+        """
+        try:
+            key = (os.path.abspath(path), tuple(columns) if columns is not None else None)
+            mtime = os.path.getmtime(path)
+            with self._mapped_datasets_guard:
+                cached = self._mapped_datasets.get(key)
+                if cached is None or cached[0] != mtime:
+                    data = open_memory_mapped(path, columns=columns)
+                    if not data.index.is_monotonic_increasing:
+                        # Sorting materializes the data; files should be written sorted by date
+                        data = data.sort_index()
+                    cached = (mtime, data)
+                    self._mapped_datasets[key] = cached
+            data = cached[1]
+        except Exception as e:
+            raise Exception(f"Error loading local dataset: {str(e)}")
+        
+        if start_date is None and end_date is None:
+            # The mapped frame is shared between calls; give the caller its own frame object
+            return data.copy(deep=False)
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError(
+                f"Cannot select dates from {os.path.basename(path)}: it has no Date column "
+                "(store a structured .npy array with a 'Date' field, or a Feather file with a Date column)"
+            )
+        if data.empty:
+            return data.copy(deep=False)
+        start = normalize_date(start_date) if start_date is not None else data.index[0]
+        end = normalize_date(end_date) if end_date is not None else data.index[-1] + pd.Timedelta(1)
+        return self._slice_range(data, start, end)
+    
+    def load_kragle_dataset(
+        self,
+        file_path: Union[str, Any],
+        progress_callback: Optional[Callable[[float], Any]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load a dataset from Kragle.
+        
+        CSV files are streamed in chunks: column types are inferred from a
+        sample, and each chunk is cast to float32/datetime/category before the
+        next one is parsed, so peak memory stays close to the size of the
+        result. Inferred schemas are cached per file fingerprint, so
+        re-uploading the same file skips inference.
+        
+        Supported formats are CSV (plain, .gz or .zst compressed), Excel,
+        Parquet and Feather/Arrow IPC; Parquet and Feather files on disk are
+        memory-mapped.
+        
+        Args:
+            file_path: Path to the Kragle dataset file, or an uploaded file object
+            progress_callback: Called with the fraction of the file read so far, from 0.0 to 1.0
+            chunk_rows: Rows parsed per chunk for CSV files
+            columns: Columns to read (if None, all columns)
             
+        Returns:
+            DataFrame containing the dataset
+        """
+        try:
+            return read_dataset(
+                file_path,
+                chunk_rows=chunk_rows,
+                progress_callback=progress_callback,
+                schema_cache=self.schema_cache,
+                columns=columns
+            )
         except Exception as e:
             raise Exception(f"Error loading Kragle dataset: {str(e)}")
 
-    def get_visualization_data(self, data: pd.DataFrame) -> dict:
+    def iter_feature_chunks(
+        self,
+        source: Union[pd.DataFrame, str, Any],
+        feature_columns: Optional[List[str]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream feature matrices chunk by chunk for incremental models.
+        
+        Files are read with iter_dataset_chunks, so only one chunk is held in
+        memory at a time; in-memory frames are cut into row slices. Rows with
+        a missing feature are dropped from each chunk.
+        
+        Args:
+            source: DataFrame, file path, or uploaded file object
+            feature_columns: Columns to use as features (if None, all numeric columns)
+            chunk_rows: Rows per chunk
+            
+        Yields:
+            C-contiguous float32 arrays of shape (n_rows, n_features)
+        """
+        if isinstance(source, pd.DataFrame):
+            chunks = (source.iloc[start:start + chunk_rows] for start in range(0, len(source), chunk_rows))
+        else:
+            chunks = iter_dataset_chunks(
+                source,
+                chunk_rows=chunk_rows,
+                schema_cache=self.schema_cache,
+                columns=feature_columns
+            )
+        
+        for chunk in chunks:
+            columns = feature_columns
+            if columns is None:
+                columns = list(chunk.select_dtypes(include=[np.number]).columns)
+            X = np.ascontiguousarray(chunk[columns].to_numpy(dtype=np.float32))
+            valid = ~np.isnan(X).any(axis=1)
+            yield X if valid.all() else X[valid]
+
+    def get_visualization_data(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[List[str]] = None
+    ) -> VisualizationBundle:
         """
         Prepare data for various visualizations.
         
+        The result is a lazy read-only mapping: each member is built on first
+        access as a view of one shared frame, and the correlation matrix is
+        only computed when it is asked for. Results are memoized on a content
+        hash of the input, so identical data across reruns and sessions
+        returns the same bundle.
+        
         Args:
             data: DataFrame containing stock data
+            indicators: Names of the indicators to compute (if None, all registered indicators);
+                visualizations needing an indicator that was not requested are left out
             
         Returns:
-            Dictionary containing data for different visualizations
+            Mapping containing data for different visualizations
         """
-        df = data.copy()
+        key = ('visualization', frame_fingerprint(data, indicators))
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
         
-        # Ensure numeric columns are float32
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df[col] = df[col].astype('float32')
+        # Indicators only depend on the raw columns, so data that already went
+        # through calculate_technical_indicators is served from the memoized result
+        indicator_df = self.calculate_technical_indicators(data, indicators=indicators)
+        registered = set(indicator_names())
+        raw_cols = [col for col in indicator_df.columns if col not in registered]
+        indicator_cols = [col for col in indicator_df.columns if col in registered]
+        
+        # Work on a shallow copy so the (read-only) indicator frame is never modified
+        df = indicator_df.copy(deep=False)
         
         # Calculate daily returns
         df['Daily_Return'] = df['Close'].pct_change().astype('float32')
@@ -309,24 +1067,34 @@ class DataLoader:
         # Calculate price ranges
         df['Daily_Range'] = ((df['High'] - df['Low']) / df['Close']).astype('float32')
         
-        # Calculate technical indicators
-        df = self.calculate_technical_indicators(df)
-        
-        # Prepare correlation data
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        correlation_data = df[numeric_cols].corr().astype('float32')
-        
-        # Ensure all returned DataFrames use float32
-        return {
-            'price_data': df[['Close', 'High', 'Low']].astype('float32'),
-            'volume_data': df[['Volume', 'Volume_MA']].astype('float32'),
-            'returns_data': df[['Daily_Return', 'Cumulative_Return']].astype('float32'),
-            'volatility_data': df[['Volatility', 'Daily_Range']].astype('float32'),
-            'momentum_data': df[['Momentum', 'RSI']].astype('float32'),
-            'technical_indicators': df[['SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'MACD', 'Signal_Line']].astype('float32'),
-            'correlation_data': correlation_data,
-            'bollinger_bands': df[['Close', 'BB_Upper', 'BB_Middle', 'BB_Lower']].astype('float32')
+        # Clean up warm-up NaN values using bfill and ffill, as for the raw columns
+        derived_cols = [col for col in df.columns if col not in indicator_df.columns]
+        df[derived_cols] = df[derived_cols].bfill().ffill()
+        
+        # One read-only float32 block that all members view
+        df = freeze_frame(df[raw_cols + derived_cols + indicator_cols])
+        
+        groups = {
+            'price_data': ['Close', 'High', 'Low'],
+            'volume_data': ['Volume', 'Volume_MA'],
+            'returns_data': ['Daily_Return', 'Cumulative_Return'],
+            'volatility_data': ['Volatility', 'Daily_Range'],
+            'momentum_data': ['Momentum', 'RSI'],
+            'technical_indicators': ['SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'MACD', 'Signal_Line'],
+            'bollinger_bands': ['Close', 'BB_Upper', 'BB_Middle', 'BB_Lower']
         }
+        
+        bundle = VisualizationBundle(df, groups)
+        self.result_cache.put(key, bundle, nbytes=estimate_nbytes(df))
+        return bundle
 
-# Create a singleton instance
-data_loader = DataLoader() 
\ No newline at end of file
+# Create a singleton instance; the default store lives under the project root
+# rather than the working directory the app happens to be started from
+data_loader = DataLoader(
+    cache_dir=os.environ.get(
+        'PFF_CACHE_DIR',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'cache')
+    ),
+    cache_max_bytes=int(os.environ.get('PFF_CACHE_MAX_BYTES', 256 * 1024 ** 2)),
+    watchlist=[s.strip() for s in os.environ.get('PFF_WATCHLIST', '').split(',') if s.strip()]
+) 
\ No newline at end of file
@@ -0,0 +1,529 @@
+import hashlib
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .frame_cache import FrameCache
+
+# Rows parsed per chunk; bounds the parser's working memory independently of the file size
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Rows read up front to infer column types
+SAMPLE_ROWS = 1_000
+
+# Values tried against each date format before the whole sample is checked
+PROBE_VALUES = 20
+
+# Fixed date formats probed in order; ISO8601 covers variants with times and offsets
+DATE_FORMATS = [
+    '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y',
+    '%d.%m.%Y', '%d-%b-%Y', '%b %d, %Y', '%Y%m%d', 'ISO8601'
+]
+
+# Text columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_RATIO = 0.5
+
+# Bytes hashed at each end of a file to fingerprint it
+FINGERPRINT_BYTES = 64 * 1024
+
+# Supported file suffixes -> (format, compression)
+FILE_FORMATS = {
+    '.csv': ('csv', None),
+    '.csv.gz': ('csv', 'gzip'),
+    '.csv.zst': ('csv', 'zstd'),
+    '.xlsx': ('excel', None),
+    '.parquet': ('parquet', None),
+    '.feather': ('feather', None),
+    '.arrow': ('feather', None)
+}
+
+# Compression suffixes of FILE_FORMATS; only CSV files may carry them
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+
+# Extensions for upload widgets, which match the last extension only: compressed
+# files pass as gz/zst and detect_format rejects those that are not CSV
+UPLOAD_EXTENSIONS = list(dict.fromkeys(suffix.rsplit('.', 1)[-1] for suffix in FILE_FORMATS))
+
+ProgressCallback = Callable[[float], Any]
+
+
+def source_name(source: Any) -> str:
+    """
+    Get the file name of a path or an uploaded file object.
+
+    Args:
+        source: File path, or file-like object such as a Streamlit UploadedFile
+
+    Returns:
+        File name, or the source itself as a string
+    """
+    return str(getattr(source, 'name', source))
+
+
+class DatasetSchema:
+    def __init__(self, kinds: Dict[str, str], date_formats: Optional[Dict[str, str]] = None):
+        """
+        Initialize an inferred dataset schema.
+
+        Args:
+            kinds: Column name -> 'numeric', 'date', 'category' or 'text'
+            date_formats: Date column name -> strftime format (or 'ISO8601') it parses with
+        """
+        self.kinds = kinds
+        self.date_formats = date_formats or {}
+
+    def __repr__(self) -> str:
+        return f"DatasetSchema({self.kinds})"
+
+
+def detect_date_format(values: pd.Series) -> Optional[str]:
+    """
+    Find a fixed date format that parses every value.
+
+    A few values are probed against each candidate format first, so text
+    columns are rejected without parsing the whole sample.
+
+    Args:
+        values: Non-null text values
+
+    Returns:
+        Matching format, or None if the values are not dates
+    """
+    if values.empty:
+        return None
+    probe = values.iloc[:PROBE_VALUES].astype(str)
+    # Dates contain digits and are short; this rules out most text columns at once
+    if not probe.str.contains(r'\d', regex=True).all() or probe.str.len().max() > 40:
+        return None
+
+    for fmt in DATE_FORMATS:
+        if pd.to_datetime(probe, format=fmt, errors='coerce').notna().all():
+            if pd.to_datetime(values.astype(str), format=fmt, errors='coerce').notna().all():
+                return fmt
+    return None
+
+
+def infer_schema(sample: pd.DataFrame) -> DatasetSchema:
+    """
+    Infer column kinds from a sample of rows.
+
+    Numeric columns are taken from the parsed dtypes. Text columns are dates
+    if a fixed format parses all sampled values, categories if few distinct
+    values repeat, and plain text otherwise.
+
+    Args:
+        sample: First rows of the dataset, as parsed by pandas
+
+    Returns:
+        Inferred schema
+    """
+    kinds: Dict[str, str] = {}
+    date_formats: Dict[str, str] = {}
+    for col in sample.columns:
+        values = sample[col]
+        if pd.api.types.is_numeric_dtype(values):
+            kinds[col] = 'numeric'
+            continue
+        if pd.api.types.is_datetime64_any_dtype(values):
+            kinds[col] = 'date'
+            continue
+
+        present = values.dropna()
+        fmt = detect_date_format(present)
+        if fmt is not None:
+            kinds[col] = 'date'
+            date_formats[col] = fmt
+        elif not present.empty and present.nunique() <= CATEGORY_MAX_RATIO * len(present):
+            kinds[col] = 'category'
+        else:
+            kinds[col] = 'text'
+    return DatasetSchema(kinds, date_formats)
+
+
+def convert_chunk(chunk: pd.DataFrame, schema: DatasetSchema) -> pd.DataFrame:
+    """
+    Cast the columns of a chunk according to an inferred schema.
+
+    Numeric columns become float32 (unparseable values become NaN), date
+    columns datetime with their detected format (unparseable values become
+    NaT) and categorical columns category; text is left as is.
+
+    Args:
+        chunk: Parsed rows
+        schema: Schema from infer_schema
+
+    Returns:
+        The converted chunk
+    """
+    for col in chunk.columns:
+        kind = schema.kinds.get(col, 'text')
+        if kind == 'numeric':
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce').astype('float32')
+        elif kind == 'date':
+            chunk[col] = pd.to_datetime(chunk[col], format=schema.date_formats.get(col), errors='coerce')
+        elif kind == 'category':
+            chunk[col] = chunk[col].astype('category')
+    return chunk
+
+
+def file_fingerprint(handle) -> Optional[str]:
+    """
+    Fingerprint a file from its size and the bytes at its head and tail.
+
+    Cheap enough to compute on every upload, and stable across re-uploads of
+    the same file; the stream position is restored afterwards.
+
+    Args:
+        handle: Seekable binary file object
+
+    Returns:
+        Hex digest, or None if the file is not seekable
+    """
+    try:
+        position = handle.tell()
+        size = handle.seek(0, os.SEEK_END)
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        handle.seek(0)
+        digest.update(handle.read(FINGERPRINT_BYTES))
+        handle.seek(max(size - FINGERPRINT_BYTES, 0))
+        digest.update(handle.read(FINGERPRINT_BYTES))
+        handle.seek(position)
+        return digest.hexdigest()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _file_size(handle) -> Optional[int]:
+    try:
+        position = handle.tell()
+        size = handle.seek(0, os.SEEK_END)
+        handle.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _assemble(parts: Dict[str, List[pd.Series]]) -> pd.DataFrame:
+    # Concatenating column by column frees each column's chunks as soon as it is
+    # joined, so peak memory stays near the final frame size rather than twice it
+    columns = list(parts)
+    data = {}
+    for col in columns:
+        pieces = parts.pop(col)
+        if pieces and all(isinstance(p.dtype, pd.CategoricalDtype) for p in pieces):
+            # Chunks see different categories; a plain concat would fall back to object
+            data[col] = pd.Series(union_categoricals(pieces))
+        else:
+            data[col] = pd.concat(pieces, ignore_index=True) if pieces else pd.Series(dtype=object)
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+def detect_format(name: str) -> Tuple[str, Optional[str]]:
+    """
+    Determine a dataset's format and compression from its file name.
+
+    Args:
+        name: File name
+
+    Returns:
+        Tuple of (format, compression), where format is 'csv', 'excel', 'parquet' or 'feather'
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    name = name.lower()
+    # Longest suffixes first, so '.csv.gz' wins over '.gz'
+    for suffix in sorted(FILE_FORMATS, key=len, reverse=True):
+        if name.endswith(suffix):
+            return FILE_FORMATS[suffix]
+    if name.endswith(COMPRESSED_SUFFIXES):
+        raise ValueError(
+            "Unsupported compressed file. Only CSV files can be compressed; "
+            "name them .csv.gz or .csv.zst."
+        )
+    raise ValueError(
+        "Unsupported file format. Please use .csv (optionally .gz/.zst compressed), "
+        ".xlsx, .parquet or .feather/.arrow files."
+    )
+
+
+def _csv_schema(handle, sample_rows: int, schema_cache: Optional[FrameCache], options: Dict[str, Any]) -> DatasetSchema:
+    # Infer from the first rows (or reuse the cached schema of the same file) and rewind
+    start = handle.tell()
+    columns = options.get('usecols')
+    fingerprint = file_fingerprint(handle) if schema_cache is not None else None
+    key = (fingerprint, tuple(columns) if columns is not None else None)
+    schema = schema_cache.get(key) if fingerprint is not None else None
+    if schema is None:
+        schema = infer_schema(pd.read_csv(handle, nrows=sample_rows, **options))
+        handle.seek(start)
+        if fingerprint is not None:
+            schema_cache.put(key, schema)
+    return schema
+
+
+def _text_dtypes(schema: DatasetSchema) -> Dict[str, type]:
+    # Parse non-numeric columns as text in every chunk: pandas would otherwise infer
+    # float for a chunk where such a column is empty and int where it looks numeric,
+    # and the chunks' categories could no longer be combined
+    return {col: str for col, kind in schema.kinds.items() if kind != 'numeric'}
+
+
+def read_csv_chunked(
+    source: Any,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    sample_rows: int = SAMPLE_ROWS,
+    progress_callback: Optional[ProgressCallback] = None,
+    schema_cache: Optional[FrameCache] = None,
+    columns: Optional[List[str]] = None,
+    compression: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Read a CSV file in chunks with bounded memory.
+
+    Column types are inferred from the first sample_rows rows; every chunk is
+    then cast on its own (numeric columns to float32, detected date columns to
+    datetime, categorical columns to category) before the next one is parsed.
+
+    Args:
+        source: File path, or seekable binary file-like object
+        chunk_rows: Rows parsed per chunk
+        sample_rows: Rows used to infer the schema
+        progress_callback: Called with the fraction of the file read so far, from 0.0 to 1.0
+        schema_cache: Cache of inferred schemas keyed by file fingerprint, so that
+            re-reading the same file skips inference
+        columns: Columns to read (if None, all columns)
+        compression: 'gzip' or 'zstd' for compressed files (if None, uncompressed)
+
+    Returns:
+        DataFrame containing the dataset
+    """
+    handle = open(source, 'rb') if isinstance(source, str) else source
+    options = {'usecols': columns, 'compression': compression}
+    try:
+        start = handle.tell()
+        total = _file_size(handle)
+
+        schema = _csv_schema(handle, sample_rows, schema_cache, options)
+
+        parts: Dict[str, List[pd.Series]] = {col: [] for col in schema.kinds}
+        for chunk in pd.read_csv(handle, chunksize=chunk_rows, dtype=_text_dtypes(schema), **options):
+            chunk = convert_chunk(chunk, schema)
+            for col in chunk.columns:
+                parts.setdefault(col, []).append(chunk[col])
+            # For compressed files this is the share of compressed bytes consumed
+            if progress_callback is not None and total:
+                progress_callback(min((handle.tell() - start) / total, 1.0))
+    finally:
+        if handle is not source:
+            handle.close()
+
+    data = _assemble(parts)
+    if progress_callback is not None:
+        progress_callback(1.0)
+    return data
+
+
+def read_arrow_dataset(source: Any, file_format: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet or Feather/Arrow IPC file through pyarrow.
+
+    Files on disk are memory-mapped, and uploaded files are read straight from
+    their in-memory buffer; only the requested columns are decoded.
+
+    Args:
+        source: File path, or file-like object
+        file_format: 'parquet' or 'feather'
+        columns: Columns to read (if None, all columns)
+
+    Returns:
+        DataFrame with numeric columns as float32
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    memory_map = isinstance(source, str)
+    if hasattr(source, 'getbuffer'):
+        # Wrap the upload's bytes without copying them
+        source = pa.BufferReader(pa.py_buffer(source.getbuffer()))
+
+    if file_format == 'parquet':
+        # With the pandas metadata the stored index columns are read even when
+        # the columns are projected, so the frame keeps its (date) index
+        table = pq.read_table(source, columns=columns, memory_map=memory_map, use_pandas_metadata=True)
+    else:
+        table = feather.read_table(source, columns=columns, memory_map=memory_map)
+
+    # split_blocks avoids consolidating the columns into one copied block, and
+    # self_destruct releases each Arrow column as soon as it is converted
+    data = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    return convert_chunk(data, infer_schema(data.head(SAMPLE_ROWS)))
+
+
+def read_dataset(
+    source: Any,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    progress_callback: Optional[ProgressCallback] = None,
+    schema_cache: Optional[FrameCache] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a tabular dataset, choosing the reader from the file extension.
+
+    Args:
+        source: File path, or file-like object with a name attribute
+        chunk_rows: Rows parsed per chunk for CSV files
+        progress_callback: Called with the fraction of the file read so far
+        schema_cache: Cache of inferred CSV schemas keyed by file fingerprint
+        columns: Columns to read (if None, all columns)
+
+    Returns:
+        DataFrame with numeric columns as float32 and date columns as datetime
+    """
+    file_format, compression = detect_format(source_name(source))
+    if file_format == 'csv':
+        return read_csv_chunked(
+            source,
+            chunk_rows=chunk_rows,
+            progress_callback=progress_callback,
+            schema_cache=schema_cache,
+            columns=columns,
+            compression=compression
+        )
+
+    if file_format == 'excel':
+        data = pd.read_excel(source, usecols=columns)
+        data = convert_chunk(data, infer_schema(data.head(SAMPLE_ROWS)))
+    else:
+        data = read_arrow_dataset(source, file_format, columns=columns)
+
+    if progress_callback is not None:
+        progress_callback(1.0)
+    return data
+
+
+def iter_dataset_chunks(
+    source: Any,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    schema_cache: Optional[FrameCache] = None,
+    columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a tabular dataset in chunks without assembling it.
+
+    Only one chunk is held in memory at a time (Parquet and Feather files
+    are read batch by batch from a memory map), so arbitrarily long files can
+    be streamed into incremental models. Every chunk is converted with the
+    schema inferred from the start of the file, so column types are the same
+    in all chunks.
+
+    Args:
+        source: File path, or file-like object with a name attribute
+        chunk_rows: Rows per chunk
+        schema_cache: Cache of inferred CSV schemas keyed by file fingerprint
+        columns: Columns to read (if None, all columns)
+
+    Yields:
+        DataFrames of at most chunk_rows rows, numeric columns as float32
+    """
+    file_format, compression = detect_format(source_name(source))
+    if file_format == 'csv':
+        handle = open(source, 'rb') if isinstance(source, str) else source
+        options = {'usecols': columns, 'compression': compression}
+        try:
+            schema = _csv_schema(handle, SAMPLE_ROWS, schema_cache, options)
+            for chunk in pd.read_csv(handle, chunksize=chunk_rows, dtype=_text_dtypes(schema), **options):
+                yield convert_chunk(chunk, schema)
+        finally:
+            if handle is not source:
+                handle.close()
+        return
+
+    if file_format == 'excel':
+        data = read_dataset(source, columns=columns)
+        for start in range(0, len(data), chunk_rows):
+            yield data.iloc[start:start + chunk_rows]
+        return
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    memory_map = isinstance(source, str)
+    if hasattr(source, 'getbuffer'):
+        source = pa.BufferReader(pa.py_buffer(source.getbuffer()))
+    if file_format == 'parquet':
+        batches = pq.ParquetFile(source, memory_map=memory_map).iter_batches(
+            batch_size=chunk_rows, columns=columns, use_pandas_metadata=True
+        )
+    else:
+        batches = feather.read_table(source, columns=columns, memory_map=memory_map).to_batches(max_chunksize=chunk_rows)
+
+    schema = None
+    for batch in batches:
+        chunk = batch.to_pandas(split_blocks=True)
+        if schema is None:
+            schema = infer_schema(chunk.head(SAMPLE_ROWS))
+        yield convert_chunk(chunk, schema)
+
+
+def open_memory_mapped(
+    path: str,
+    columns: Optional[List[str]] = None,
+    index_column: str = 'Date'
+) -> pd.DataFrame:
+    """
+    Open a local OHLCV file as a DataFrame backed by a memory map.
+
+    The columns are read-only views of the mapped file, so nothing is loaded
+    until it is touched, row slices stay views, and processes mapping the same
+    file share the OS page cache. Feather/Arrow files must be written
+    uncompressed (compression='uncompressed') for their columns to be mapped
+    without decoding. .npy files hold either a structured array with one field
+    per column, or a 2D array whose column names are given by columns. A 2D
+    float array cannot hold dates, so its frame keeps a row-number index.
+
+    Args:
+        path: Path to a .feather, .arrow or .npy file
+        columns: Columns to expose (for 2D .npy arrays, the names of all array columns)
+        index_column: Column used as the index if present
+
+    Returns:
+        DataFrame viewing the mapped data, indexed by index_column if present
+    """
+    name = path.lower()
+    if name.endswith(('.feather', '.arrow')):
+        import pyarrow.feather as feather
+
+        table = feather.read_table(path, memory_map=True)
+        if columns is not None:
+            keep = [index_column] if index_column in table.column_names and index_column not in columns else []
+            table = table.select(keep + list(columns))
+        # split_blocks keeps one block per column, so numeric columns without
+        # nulls are converted without copying out of the map
+        data = table.to_pandas(split_blocks=True)
+    elif name.endswith('.npy'):
+        array = np.load(path, mmap_mode='r')
+        if array.dtype.names is not None:
+            fields = columns if columns is not None else list(array.dtype.names)
+            if index_column in array.dtype.names and index_column not in fields:
+                fields = [index_column] + fields
+            arrays = {field: array[field] for field in fields}
+        elif array.ndim == 2 and columns is not None and len(columns) == array.shape[1]:
+            arrays = {col: array[:, i] for i, col in enumerate(columns)}
+        else:
+            raise ValueError("2D .npy files need one column name per array column")
+        data = pd.DataFrame(arrays, copy=False)
+    else:
+        raise ValueError("Unsupported file format. Please use .feather, .arrow or .npy files.")
+
+    if index_column in data.columns:
+        data = data.set_index(index_column)
+        if not isinstance(data.index, pd.DatetimeIndex):
+            data.index = pd.to_datetime(data.index)
+    return data
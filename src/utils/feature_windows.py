@@ -0,0 +1,118 @@
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def window_view(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    View a (n_rows, n_features) array as overlapping windows of consecutive rows.
+
+    Args:
+        values: Feature matrix, one row per time step
+        window: Number of rows per window
+
+    Returns:
+        Read-only view of shape (n_rows - window + 1, window, n_features);
+        window i covers rows i .. i + window - 1
+    """
+    # sliding_window_view appends the window axis last; move it before the features
+    return sliding_window_view(values, window, axis=0).transpose(0, 2, 1)
+
+
+def horizon_targets(target: np.ndarray, horizons: Sequence[int], first_row: int, n_samples: int) -> np.ndarray:
+    """
+    Gather targets at several horizons for consecutive samples.
+
+    Args:
+        target: Target column, one value per time step
+        horizons: Steps ahead of each sample's reference row
+        first_row: Reference row of the first sample
+        n_samples: Number of samples
+
+    Returns:
+        float32 array of shape (n_samples, len(horizons)); NaN where a horizon runs past the data
+    """
+    Y = np.full((n_samples, len(horizons)), np.nan, dtype=np.float32)
+    for k, horizon in enumerate(horizons):
+        start = first_row + horizon
+        available = max(min(n_samples, len(target) - start), 0)
+        Y[:available, k] = target[start:start + available]
+    return Y
+
+
+def compact_rows(valid: np.ndarray) -> Union[slice, np.ndarray]:
+    """
+    Express the valid entries of a mask as a slice when they are contiguous.
+
+    Args:
+        valid: Boolean mask
+
+    Returns:
+        Slice over the valid block, or the indices of the valid entries
+    """
+    rows = np.flatnonzero(valid)
+    if len(rows) == 0:
+        return slice(0, 0)
+    if rows[-1] - rows[0] + 1 == len(rows):
+        return slice(int(rows[0]), int(rows[-1]) + 1)
+    return rows
+
+
+def build_windows(
+    features: np.ndarray,
+    target: np.ndarray,
+    window: int,
+    horizons: Sequence[int] = (1,),
+    flatten: bool = False
+) -> Tuple[np.ndarray, np.ndarray, Union[slice, np.ndarray]]:
+    """
+    Build a lagged-window design with targets at several horizons.
+
+    Sample i uses feature rows i .. i + window - 1 and predicts the target
+    h rows after the window's last row, for each horizon h. Samples whose
+    window or targets contain NaN are dropped. When the kept samples are
+    contiguous (the usual case, as only the last max(horizons) rows lack
+    targets), X is a strided view of features and no feature data is
+    duplicated; otherwise the kept windows are gathered into a new array.
+
+    Args:
+        features: Feature matrix of shape (n_rows, n_features)
+        target: Target column of length n_rows
+        window: Number of consecutive rows per sample
+        horizons: Steps ahead to predict
+        flatten: Whether to reshape X to (n_samples, window * n_features) for 2D models
+            (this materializes the windows)
+
+    Returns:
+        Tuple of (X of shape (n_samples, window, n_features) or flattened,
+        Y of shape (n_samples, len(horizons)), rows), where rows selects each
+        sample's last window row in the input
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+    n_rows = len(features)
+    n_windows = max(n_rows - window + 1, 0)
+    if n_windows == 0:
+        X = np.empty((0, window, features.shape[1]), dtype=features.dtype)
+        Y = np.empty((0, len(horizons)), dtype=np.float32)
+        return (X.reshape(0, -1) if flatten else X), Y, slice(0, 0)
+
+    # A window is valid if it holds no NaN rows: compare counts of NaN rows at its ends
+    bad_rows = np.concatenate([[0], np.cumsum(np.isnan(features).any(axis=1))])
+    valid = bad_rows[window:] == bad_rows[:n_windows]
+
+    Y = horizon_targets(target, horizons, window - 1, n_windows)
+    valid &= ~np.isnan(Y).any(axis=1)
+
+    samples = compact_rows(valid)
+    X = window_view(features, window)[samples]
+    Y = Y[samples]
+    if flatten:
+        X = X.reshape(len(X), -1)
+
+    if isinstance(samples, slice):
+        rows = slice(samples.start + window - 1, samples.stop + window - 1)
+    else:
+        rows = samples + window - 1
+    return X, Y, rows
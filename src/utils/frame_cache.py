@@ -0,0 +1,245 @@
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    Args:
+        value: DataFrame, Series, array, or a dict/list/tuple of those
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _hash_values(digest, values: Any) -> None:
+    # Numeric and datetime buffers are hashed as raw bytes; anything else
+    # (strings, categoricals, MultiIndex tuples) through pandas' row hashing
+    array = None if isinstance(values, pd.MultiIndex) else values.to_numpy()
+    if array is not None and array.dtype.kind in 'biufcmM':
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    else:
+        digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+
+def frame_fingerprint(data: pd.DataFrame, *params: Any) -> str:
+    """
+    Compute a content hash of a frame for memoizing results derived from it.
+
+    The hash covers the index, column names, dtypes and column buffers, so
+    equal frames give equal fingerprints however they were constructed.
+
+    Args:
+        data: DataFrame to fingerprint
+        *params: Extra parameters of the computation to include in the hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((data.shape, list(data.columns), [str(t) for t in data.dtypes], params)).encode())
+    _hash_values(digest, data.index)
+    for i in range(data.shape[1]):
+        _hash_values(digest, data.iloc[:, i])
+    return digest.hexdigest()
+
+
+def freeze_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Consolidate an all-numeric frame into a single read-only float32 block.
+
+    Frozen frames can be handed out (and row-sliced) without copies: any
+    in-place write into them raises instead of corrupting the shared data.
+    Frames with non-numeric columns are returned unchanged.
+
+    Args:
+        data: DataFrame to freeze
+
+    Returns:
+        Read-only DataFrame sharing one column-major float32 buffer
+    """
+    if data.empty or len(data.select_dtypes(include=[np.number]).columns) != data.shape[1]:
+        return data
+
+    # Column-major so that every column is a contiguous view
+    values = np.asfortranarray(data.to_numpy(dtype=np.float32))
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+
+
+class FrameCache:
+    def __init__(self, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize a thread-safe LRU cache bounded by a memory budget.
+
+        Args:
+            max_bytes: Memory budget in bytes (if None, the cache is unbounded)
+            ttl: Seconds after which an entry expires (if None, entries never expire)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, nbytes, stored_at)
+        self._lock = threading.RLock()
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+    def _remove(self, key: Hashable) -> None:
+        _, nbytes, _ = self._entries.pop(key)
+        self.current_bytes -= nbytes
+
+    def _lookup(self, key: Hashable) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry[2]):
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value, marking it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value without updating recency or hit/miss counters.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is absent
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            return default if entry is None else entry[0]
+
+    def record_miss(self) -> None:
+        """
+        Count a miss that was detected by the caller (e.g. a partially covered range).
+        """
+        with self._lock:
+            self.misses += 1
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries to stay within budget.
+
+        Values larger than the whole budget are not cached.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            nbytes: Size of the value in bytes (estimated if None)
+        """
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                self.evictions += 1
+                return
+
+            self._entries[key] = (value, nbytes, time.monotonic())
+            self.current_bytes += nbytes
+
+            while self.max_bytes is not None and self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is absent
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        """
+        Remove all entries (counters are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary of counters and memory usage
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
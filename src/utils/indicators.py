@@ -0,0 +1,720 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+# Raw input columns the indicator graph is built on
+SOURCE_COLUMNS = ['Close', 'High', 'Low', 'Volume']
+
+
+class IndicatorSpec:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., np.ndarray],
+        inputs: Sequence[str],
+        output: bool = True,
+        lookback: int = 0,
+        recursive: bool = False
+    ):
+        """
+        Describe one node of the indicator graph.
+
+        Args:
+            name: Node name (the output column name for indicators)
+            func: Function computing the node from its input arrays along the last axis
+            inputs: Source columns or nodes passed to func, in order
+            output: Whether the node is an indicator or a shared intermediate
+            lookback: Number of preceding rows each value reads (window - 1 for rolling windows)
+            recursive: Whether each value continues from the previous one (EMAs, running
+                totals); such functions get their inputs from the first new row on and a seed
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.output = output
+        self.lookback = lookback
+        self.recursive = recursive
+
+
+# Registered nodes, in registration order
+INDICATOR_REGISTRY: Dict[str, IndicatorSpec] = {}
+
+
+def register_indicator(
+    name: str,
+    inputs: Sequence[str],
+    output: bool = True,
+    lookback: int = 0,
+    recursive: bool = False
+) -> Callable:
+    """
+    Decorator registering a function as a node of the indicator graph.
+
+    Args:
+        name: Node name
+        inputs: Source columns or already registered nodes the function takes
+        output: Whether the node is an indicator or a shared intermediate
+        lookback: Number of preceding rows each value reads
+        recursive: Whether each value continues from the previous one
+
+    Returns:
+        Decorator registering the function and returning it unchanged
+    """
+    def decorator(func: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+        for dependency in inputs:
+            if dependency not in SOURCE_COLUMNS and dependency not in INDICATOR_REGISTRY:
+                raise ValueError(f"Unknown input '{dependency}' for indicator '{name}'")
+        INDICATOR_REGISTRY[name] = IndicatorSpec(name, func, inputs, output, lookback, recursive)
+        return func
+    return decorator
+
+
+def indicator_names() -> List[str]:
+    """
+    Get the names of all registered indicators (intermediates excluded).
+
+    Returns:
+        Indicator names in registration order
+    """
+    return [name for name, spec in INDICATOR_REGISTRY.items() if spec.output]
+
+
+def _window_totals(csum: np.ndarray, window: int, out: np.ndarray) -> np.ndarray:
+    # Differences of prefix sums window positions apart
+    out[..., window - 1] = csum[..., window - 1]
+    out[..., window:] = csum[..., window:] - csum[..., :-window]
+    return out
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sum along the last axis via prefix sums.
+
+    As pandas' rolling().sum(), incomplete windows and windows containing a
+    NaN give NaN.
+
+    Args:
+        x: float64 input of shape (..., n)
+        window: Window length
+
+    Returns:
+        Rolling sums of shape (..., n)
+    """
+    out = np.full(x.shape, np.nan)
+    if x.shape[-1] < window:
+        return out
+    missing = np.isnan(x)
+    if not missing.any():
+        return _window_totals(np.cumsum(x, axis=-1), window, out)
+
+    # A NaN would poison every later prefix sum; sum zeros instead and
+    # blank the windows that contain one
+    _window_totals(np.cumsum(np.where(missing, 0.0, x), axis=-1), window, out)
+    gaps = _window_totals(np.cumsum(missing, axis=-1), window, np.zeros(x.shape, dtype=np.int64))
+    out[gaps > 0] = np.nan
+    return out
+
+
+def _first_valid(x: np.ndarray) -> np.ndarray:
+    # First non-NaN value along the last axis, shape (..., 1); 0 for all-NaN rows
+    if x.shape[-1] == 0:
+        return np.zeros(x.shape[:-1] + (1,))
+    first = np.take_along_axis(x, np.argmax(~np.isnan(x), axis=-1)[..., None], axis=-1)
+    return np.nan_to_num(first)
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    # Centering on the first value keeps the prefix sums small and accurate
+    ref = _first_valid(x)
+    return _rolling_sum(x - ref, window) / window + ref
+
+
+def _rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    # Sample standard deviation (ddof=1), as pandas' rolling().std()
+    centered = x - _first_valid(x)
+    sums = _rolling_sum(centered, window)
+    squares = _rolling_sum(centered * centered, window)
+    var = (squares - sums * sums / window) / (window - 1)
+    return np.sqrt(np.maximum(var, 0.0))
+
+
+def _ema_with_gaps(x: np.ndarray, alpha: float, prev: float) -> np.ndarray:
+    """
+    EMA (adjust=False) of one series with missing values, as pandas' ewm().mean().
+
+    A missing value repeats the previous EMA. The weight of the previous EMA
+    keeps decaying over the gap, so the first value after k missing ones is
+    weighted alpha against (1 - alpha) ** (k + 1).
+
+    Args:
+        x: float64 series of shape (n,)
+        alpha: Smoothing factor
+        prev: EMA value of the row preceding x (NaN if none)
+
+    Returns:
+        EMA of shape (n,)
+    """
+    out = np.empty_like(x)
+    observed = np.flatnonzero(~np.isnan(x))
+    # Runs of consecutive observations are filtered in one call each
+    runs = np.split(observed, np.flatnonzero(np.diff(observed) > 1) + 1) if observed.size else []
+    last, done = -1, 0
+    for run in runs:
+        first, stop = run[0], run[-1] + 1
+        out[done:first] = prev
+        if np.isnan(prev):
+            prev = x[first]
+        else:
+            decay = (1.0 - alpha) ** (first - last)
+            prev = (decay * prev + alpha * x[first]) / (decay + alpha)
+        out[first] = prev
+        if stop - first > 1:
+            out[first + 1:stop], _ = lfilter(
+                [alpha], [1.0, alpha - 1.0], x[first + 1:stop], zi=[(1.0 - alpha) * prev]
+            )
+            prev = out[stop - 1]
+        last, done = stop - 1, stop
+    out[done:] = prev
+    return out
+
+
+def _ema(x: np.ndarray, span: int, seed: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Exponential moving average (adjust=False) along the last axis.
+
+    Args:
+        x: float64 input of shape (..., n)
+        span: EMA span
+        seed: EMA value of the row preceding x, shape (...) (if None, starts at x[..., 0])
+
+    Returns:
+        EMA of shape (..., n)
+    """
+    alpha = 2.0 / (span + 1.0)
+    prev = x[..., :1] if seed is None else np.asarray(seed, dtype=np.float64)[..., None]
+    # y[t] = alpha * x[t] + (1 - alpha) * y[t-1], run as a first-order IIR filter
+    ema, _ = lfilter([alpha], [1.0, alpha - 1.0], x, axis=-1, zi=(1.0 - alpha) * prev)
+
+    # Series with missing values are redone one by one
+    missing = np.isnan(x)
+    if not missing.any():
+        return ema
+    n = x.shape[-1]
+    rows, ema = x.reshape(-1, n), ema.reshape(-1, n)
+    if seed is None:
+        seeds = np.full(len(rows), np.nan)
+    else:
+        seeds = np.broadcast_to(prev, x.shape[:-1] + (1,)).ravel()
+    for i in np.flatnonzero(missing.reshape(-1, n).any(axis=1)):
+        ema[i] = _ema_with_gaps(rows[i], alpha, seeds[i])
+    return ema.reshape(x.shape)
+
+
+# Shared intermediates
+
+@register_indicator('prev_close', inputs=['Close'], output=False, lookback=1)
+def _prev_close(close):
+    prev = np.empty_like(close)
+    prev[..., 0] = np.nan
+    prev[..., 1:] = close[..., :-1]
+    return prev
+
+
+@register_indicator('close_diff', inputs=['Close', 'prev_close'], output=False)
+def _close_diff(close, prev_close):
+    delta = close - prev_close
+    delta[..., 0] = 0.0
+    return delta
+
+
+@register_indicator('EMA_12', inputs=['Close'], output=False, recursive=True)
+def _ema_12(close, seed=None):
+    return _ema(close, 12, seed)
+
+
+@register_indicator('EMA_26', inputs=['Close'], output=False, recursive=True)
+def _ema_26(close, seed=None):
+    return _ema(close, 26, seed)
+
+
+@register_indicator('bb_std', inputs=['Close'], output=False, lookback=19)
+def _bb_std(close):
+    return _rolling_std(close, 20)
+
+
+@register_indicator('avg_gain', inputs=['close_diff'], output=False, lookback=13)
+def _avg_gain(delta):
+    # fmax counts a missing change as no gain, like delta.where(delta > 0, 0)
+    return _rolling_mean(np.fmax(delta, 0.0), 14)
+
+
+@register_indicator('avg_loss', inputs=['close_diff'], output=False, lookback=13)
+def _avg_loss(delta):
+    return _rolling_mean(np.fmax(-delta, 0.0), 14)
+
+
+@register_indicator('true_range', inputs=['High', 'Low', 'prev_close'], output=False)
+def _true_range(high, low, prev_close):
+    # fmax skips the missing previous close of the first row
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+# Indicators, in the column order of calculate_technical_indicators
+
+@register_indicator('SMA_20', inputs=['Close'], lookback=19)
+def _sma_20(close):
+    return _rolling_mean(close, 20)
+
+
+@register_indicator('SMA_50', inputs=['Close'], lookback=49)
+def _sma_50(close):
+    return _rolling_mean(close, 50)
+
+
+@register_indicator('EMA_20', inputs=['Close'], recursive=True)
+def _ema_20(close, seed=None):
+    return _ema(close, 20, seed)
+
+
+@register_indicator('EMA_50', inputs=['Close'], recursive=True)
+def _ema_50(close, seed=None):
+    return _ema(close, 50, seed)
+
+
+@register_indicator('RSI', inputs=['avg_gain', 'avg_loss'])
+def _rsi(avg_gain, avg_loss):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@register_indicator('MACD', inputs=['EMA_12', 'EMA_26'])
+def _macd(ema_12, ema_26):
+    return ema_12 - ema_26
+
+
+@register_indicator('Signal_Line', inputs=['MACD'], recursive=True)
+def _signal_line(macd, seed=None):
+    return _ema(macd, 9, seed)
+
+
+@register_indicator('BB_Middle', inputs=['SMA_20'])
+def _bb_middle(sma_20):
+    return sma_20
+
+
+@register_indicator('BB_Upper', inputs=['SMA_20', 'bb_std'])
+def _bb_upper(sma_20, bb_std):
+    return sma_20 + 2.0 * bb_std
+
+
+@register_indicator('BB_Lower', inputs=['SMA_20', 'bb_std'])
+def _bb_lower(sma_20, bb_std):
+    return sma_20 - 2.0 * bb_std
+
+
+@register_indicator('ATR', inputs=['true_range'], lookback=13)
+def _atr(true_range):
+    return _rolling_mean(true_range, 14)
+
+
+@register_indicator('OBV', inputs=['close_diff', 'Volume'], recursive=True)
+def _obv(delta, volume, seed=None):
+    flow = np.sign(delta) * volume
+    # Missing changes or volumes add nothing, like fillna(0) before the cumsum
+    obv = np.cumsum(np.where(np.isnan(flow), 0.0, flow), axis=-1)
+    if seed is not None:
+        obv += np.asarray(seed, dtype=np.float64)[..., None]
+    return obv
+
+
+# Built-in output columns of calculate_technical_indicators, in order
+INDICATOR_COLUMNS = indicator_names()
+
+
+def resolve_schedule(indicators: Sequence[str]) -> List[str]:
+    """
+    Order the nodes needed for a set of indicators so that inputs come first.
+
+    Args:
+        indicators: Requested indicator names
+
+    Returns:
+        Topologically ordered node names (source columns excluded)
+    """
+    order: List[str] = []
+    visiting = set()
+
+    def visit(name: str) -> None:
+        if name in SOURCE_COLUMNS or name in order:
+            return
+        if name not in INDICATOR_REGISTRY:
+            raise ValueError(f"Unknown indicator '{name}'")
+        if name in visiting:
+            raise ValueError(f"Circular dependency at indicator '{name}'")
+        visiting.add(name)
+        for dependency in INDICATOR_REGISTRY[name].inputs:
+            visit(dependency)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in indicators:
+        visit(name)
+    return order
+
+
+def required_sources(indicators: Sequence[str]) -> List[str]:
+    """
+    Get the raw columns read by a set of indicators.
+
+    Args:
+        indicators: Requested indicator names
+
+    Returns:
+        Source column names
+    """
+    needed = {dep for name in resolve_schedule(indicators) for dep in INDICATOR_REGISTRY[name].inputs}
+    return [col for col in SOURCE_COLUMNS if col in needed]
+
+
+def required_lookback(indicators: Sequence[str]) -> int:
+    """
+    Get the rows of raw history needed to update a set of indicators incrementally.
+
+    Args:
+        indicators: Requested indicator names
+
+    Returns:
+        Longest accumulated lookback along any dependency path
+    """
+    depth: Dict[str, int] = {col: 0 for col in SOURCE_COLUMNS}
+    for name in resolve_schedule(indicators):
+        spec = INDICATOR_REGISTRY[name]
+        depth[name] = spec.lookback + max(depth[dep] for dep in spec.inputs)
+    return max((depth[name] for name in indicators), default=0)
+
+
+def fill_gaps(block: np.ndarray) -> np.ndarray:
+    """
+    Fill NaNs along the last axis like DataFrame.bfill().ffill(), in place.
+
+    Args:
+        block: Array of shape (..., n)
+
+    Returns:
+        The same array
+    """
+    n = block.shape[-1]
+    rows = block.reshape(-1, n)
+    missing = np.isnan(rows)
+    if not missing.any():
+        return block
+
+    # Fast path for leading gaps (indicator warm-up): take the first valid value
+    row_ids = np.arange(len(rows))
+    first_valid = np.argmax(~missing, axis=1)
+    first_valid[missing[row_ids, first_valid]] = 0  # All-NaN rows stay as they are
+    leading = np.arange(n) < first_valid[:, None]
+    rows[leading] = np.repeat(rows[row_ids, first_valid], leading.sum(axis=1))
+
+    # Remaining interior and trailing gaps, row by row
+    missing &= ~leading
+    for i in np.flatnonzero(missing.any(axis=1)):
+        row, row_missing = rows[i], missing[i]
+        valid = np.flatnonzero(~row_missing)
+        if valid.size == 0:
+            continue
+        # Each gap takes the next valid value; trailing gaps take the last one
+        nxt = np.searchsorted(valid, np.flatnonzero(row_missing))
+        row[row_missing] = row[valid[np.minimum(nxt, valid.size - 1)]]
+
+    if not np.may_share_memory(rows, block):
+        block[...] = rows.reshape(block.shape)
+    return block
+
+
+def indicator_block(
+    sources: Dict[str, np.ndarray],
+    indicators: Optional[Sequence[str]] = None,
+    start: int = 0,
+    seeds: Optional[Dict[str, np.ndarray]] = None
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Compute indicators from contiguous float arrays into one preallocated block.
+
+    Only the nodes the requested indicators depend on are run, each once and
+    in dependency order, so intermediates such as the close diff are shared;
+    an intermediate is released as soon as its last consumer has run. Inputs
+    have shape (..., n) and values are computed along the last axis for
+    positions start: onward. Earlier positions only serve as lookback for the
+    windowed nodes, while recursive nodes continue from their seeds.
+
+    Args:
+        sources: float64 source columns needed by the indicators, keyed by name
+        indicators: Indicators to compute (if None, all registered indicators)
+        start: Position of the first row to compute indicators for
+        seeds: Last values of the recursive nodes before start, keyed by node name
+
+    Returns:
+        Tuple of (float32 block of shape (len(indicators), ..., n - start),
+        last values of the recursive nodes)
+    """
+    indicators = indicator_names() if indicators is None else list(indicators)
+    seeds = seeds or {}
+    schedule = resolve_schedule(indicators)
+    shape = next(iter(sources.values())).shape
+
+    # Count the consumers of each node so intermediates can be freed early
+    consumers: Dict[str, int] = {}
+    for name in schedule:
+        for dependency in INDICATOR_REGISTRY[name].inputs:
+            consumers[dependency] = consumers.get(dependency, 0) + 1
+
+    out = np.empty((len(indicators),) + shape[:-1] + (shape[-1] - start,), dtype=np.float32)
+    slots = {name: i for i, name in enumerate(indicators)}
+    values: Dict[str, np.ndarray] = dict(sources)
+    last_values: Dict[str, np.ndarray] = {}
+
+    for name in schedule:
+        spec = INDICATOR_REGISTRY[name]
+        inputs = [values[dependency] for dependency in spec.inputs]
+        if spec.recursive:
+            result = spec.func(*[x[..., start:] for x in inputs], seed=seeds.get(name))
+            last_values[name] = result[..., -1]
+            if start:
+                # Keep full-length arrays so downstream windowed nodes line up
+                padded = np.full(shape, np.nan)
+                padded[..., start:] = result
+                result = padded
+        else:
+            result = spec.func(*inputs)
+
+        if name in slots:
+            out[slots[name]] = result[..., start:]
+        values[name] = result
+
+        for dependency in spec.inputs:
+            consumers[dependency] -= 1
+            if consumers[dependency] == 0 and dependency not in sources:
+                del values[dependency]
+
+    return out, last_values
+
+
+def compute_indicators(
+    window: pd.DataFrame,
+    indicators: Optional[Sequence[str]] = None,
+    start: int = 0,
+    seeds: Optional[Dict[str, float]] = None,
+    fill_nans: bool = False
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
+    """
+    Compute technical indicators for the rows window[start:].
+
+    Rows before start are only used as lookback for the windowed indicators;
+    the recursive ones (EMAs and OBV) continue from the given seeds instead.
+
+    Args:
+        window: Frame with the source columns the indicators read
+        indicators: Indicators to compute (if None, all registered indicators)
+        start: Position of the first row to compute indicators for
+        seeds: Last values of the recursive nodes before start
+        fill_nans: Whether to fill warm-up and other gaps like bfill().ffill()
+
+    Returns:
+        Tuple of (float32 indicator frame, last values of the recursive nodes)
+    """
+    indicators = indicator_names() if indicators is None else list(indicators)
+    sources = {
+        name: window[name].to_numpy(dtype=np.float64) for name in required_sources(indicators)
+    }
+    block, last_values = indicator_block(sources, indicators, start=start, seeds=seeds)
+    if fill_nans:
+        fill_gaps(block)
+    # The transposed block is column-major, so the frame wraps it without copying
+    frame = pd.DataFrame(block.T, index=window.index[start:], columns=indicators, copy=False)
+    return frame, {name: float(v) for name, v in last_values.items()}
+
+
+def compute_panel_indicators(panel: pd.DataFrame, indicators: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Compute technical indicators of many symbols in one vectorized sweep.
+
+    The series are packed into padded (n_symbols, max_length) arrays and run
+    through indicator_block together. All indicators are causal, so padding
+    after the end of a series never affects its values.
+
+    Args:
+        panel: Frame indexed by (Symbol, Date) with rows ordered by symbol code, then date,
+            and the source columns the indicators read
+        indicators: Indicators to compute (if None, all registered indicators)
+
+    Returns:
+        float32 indicator frame aligned with the panel, gaps filled per symbol like bfill().ffill()
+    """
+    indicators = indicator_names() if indicators is None else list(indicators)
+    codes = panel.index.codes[0]
+    counts = np.bincount(codes, minlength=len(panel.index.levels[0]))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.arange(len(panel)) - starts[codes]
+    padded_shape = (len(counts), int(counts.max()) if len(counts) else 0)
+
+    padding = np.arange(padded_shape[1]) >= counts[:, None]
+
+    def pack(name: str) -> np.ndarray:
+        column = panel[name].to_numpy(dtype=np.float64)
+        values = np.empty(padded_shape)
+        values[codes, positions] = column
+        # Padding with each series' last value keeps gap-free series on the fast paths
+        last = column[starts + counts - 1] if len(column) else column
+        return np.where(padding, last[:, None], values)
+
+    block, _ = indicator_block({name: pack(name) for name in required_sources(indicators)}, indicators)
+
+    # Drop the padding before filling warm-up gaps, so they match a per-symbol run
+    block[:, padding] = np.nan
+    fill_gaps(block)
+
+    values = block[:, codes, positions]
+    return pd.DataFrame(values.T, index=panel.index, columns=indicators, copy=False)
+
+
+# Minimum number of rows reserved when the appendable result buffer is allocated
+MIN_STATE_CAPACITY = 1024
+
+
+class IndicatorState:
+    def __init__(self):
+        """
+        Initialize the carry-over state for incremental indicator updates.
+
+        Pass the same instance to successive calculate_technical_indicators
+        calls; when the new input only appends bars to the previous one, just
+        the appended tail is computed.
+        """
+        self.result: Optional[pd.DataFrame] = None  # Last output frame
+        self.tail: Optional[pd.DataFrame] = None  # Raw input rows kept as lookback
+        self.indicators: List[str] = []  # Indicators held by the result
+        self.seeds: Dict[str, float] = {}  # Last unrounded values of the recursive nodes
+        # Over-allocated float32 values and dates the result views; appended rows
+        # are written past the end instead of copying the history
+        self._values: Optional[np.ndarray] = None
+        self._dates: Optional[np.ndarray] = None
+
+    def update(
+        self,
+        result: pd.DataFrame,
+        tail: pd.DataFrame,
+        indicators: List[str],
+        seeds: Dict[str, float]
+    ) -> None:
+        """
+        Record the state after a computation.
+
+        Args:
+            result: Output frame with indicators
+            tail: Raw input rows; the last ones are kept as lookback for the next update
+            indicators: Indicators that were computed
+            seeds: Last values of the recursive nodes
+        """
+        self.result = result
+        # The lookback plus the last row: the whole window of the last result row,
+        # so can_extend sees every gap that still affects it
+        self.tail = tail.iloc[-(required_lookback(indicators) + 1):]
+        self.indicators = list(indicators)
+        self.seeds = seeds
+        self._values = self._dates = None
+
+    def can_extend(self, raw: pd.DataFrame, indicators: List[str]) -> bool:
+        """
+        Check whether raw input only appends bars to the previously computed one.
+
+        Args:
+            raw: Sorted raw input frame (without indicator columns)
+            indicators: Indicators requested now
+
+        Returns:
+            True if the previous result can be extended incrementally
+        """
+        if self.result is None or raw.empty or list(indicators) != self.indicators:
+            return False
+        if list(raw.columns) != list(self.tail.columns):
+            return False
+
+        n_prev = len(self.result)
+        # While the longest window has not filled yet, the warm-up rows of the
+        # result are not back-filled like a full computation would do it
+        if n_prev <= required_lookback(indicators) or self.result.iloc[0].isna().any():
+            return False
+        if len(raw) < n_prev or raw.index[0] != self.result.index[0]:
+            return False
+        if raw.index[n_prev - 1] != self.result.index[-1]:
+            return False
+        # A full computation fills gaps from the bars after them, which an
+        # update cannot know yet; it also needs the gap lengths for the EMAs
+        if self.tail.isna().values.any() or raw.iloc[n_prev:].isna().values.any():
+            return False
+
+        # A revised last bar (e.g. today's still-forming bar) needs a full recompute
+        return np.array_equal(
+            raw.iloc[n_prev - 1].to_numpy(),
+            self.tail.iloc[-1].to_numpy(),
+            equal_nan=True
+        )
+
+    def append(
+        self,
+        rows: pd.DataFrame,
+        window: pd.DataFrame,
+        seeds: Dict[str, float]
+    ) -> pd.DataFrame:
+        """
+        Append computed rows to the result and record the new state.
+
+        For all-float32 results with a plain datetime64 index, the rows are
+        written into an over-allocated buffer that the result views, so an
+        update costs O(new rows) amortized; frames handed out earlier keep
+        viewing their own rows, which are never rewritten. Other results are
+        concatenated.
+
+        Args:
+            rows: New output rows, with the columns of the result
+            window: Raw input rows of this update; the last ones are kept as lookback
+            seeds: Last values of the recursive nodes
+
+        Returns:
+            The extended result
+        """
+        result = self.result
+        n_prev = len(result)
+        n_total = n_prev + len(rows)
+        appendable = (
+            all(dtype == np.float32 for dtype in result.dtypes)
+            and isinstance(result.index.dtype, np.dtype)
+            and result.index.dtype.kind == 'M'
+        )
+        if not appendable:
+            extended = pd.concat([result, rows.astype('float32')])
+            self.update(extended, window, self.indicators, seeds)
+            return extended
+
+        if self._values is None or n_total > len(self._values):
+            capacity = max(2 * n_total, MIN_STATE_CAPACITY)
+            values = np.empty((capacity, result.shape[1]), dtype=np.float32, order='F')
+            dates = np.empty(capacity, dtype=result.index.dtype)
+            values[:n_prev] = result.to_numpy(dtype=np.float32)
+            dates[:n_prev] = result.index.to_numpy()
+            self._values, self._dates = values, dates
+        self._values[n_prev:n_total] = rows.to_numpy(dtype=np.float32)
+        self._dates[n_prev:n_total] = rows.index.to_numpy().astype(result.index.dtype)
+
+        values = self._values[:n_total]
+        values.flags.writeable = False
+        index = pd.DatetimeIndex(self._dates[:n_total], name=result.index.name, copy=False)
+        extended = pd.DataFrame(values, index=index, columns=result.columns, copy=False)
+
+        self.result = extended
+        self.tail = window.iloc[-(required_lookback(self.indicators) + 1):]
+        self.seeds = seeds
+        return extended
@@ -0,0 +1,237 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .indicators import compute_indicators
+
+# Class codes shared by every labeling scheme
+DOWN, STABLE, UP = 0, 1, 2
+# Rows whose outcome is unknown (missing prices, or the horizon runs past the data)
+MISSING = -1
+
+# Rows per block when scanning triple-barrier paths; bounds the (rows, max_holding) temporaries
+BARRIER_BLOCK_ROWS = 65_536
+
+
+def price_movement_classes(prices: np.ndarray, threshold: float = 0.01) -> np.ndarray:
+    """
+    Label each price by its move from the previous price.
+
+    Args:
+        prices: Array of price values
+        threshold: Minimum percentage change to consider as a movement
+
+    Returns:
+        int8 array of class labels (0: down, 1: stable, 2: up); the first price
+        has no previous price and is labelled 0
+    """
+    prices = np.asarray(prices)
+    classes = np.zeros(len(prices), dtype=np.int8)
+    if len(prices) > 1:
+        pct_change = np.diff(prices) / prices[:-1]
+        classes[1:] = np.where(pct_change > threshold, UP, np.where(pct_change < -threshold, DOWN, STABLE))
+    return classes
+
+
+def forward_returns(close: np.ndarray, horizon: int = 1) -> np.ndarray:
+    """
+    Compute the return from each row to the row horizon steps later.
+
+    Args:
+        close: Price column
+        horizon: Steps ahead
+
+    Returns:
+        float64 array of the same length as close; NaN where the horizon runs past the data
+    """
+    close = np.asarray(close, dtype=np.float64)
+    returns = np.full(len(close), np.nan)
+    if horizon < len(close):
+        returns[:-horizon] = close[horizon:] / close[:-horizon] - 1.0
+    return returns
+
+
+def _classify(scores: np.ndarray, cutoffs: np.ndarray) -> np.ndarray:
+    # One broadcast comparison labels every row against every cutoff
+    scores = scores[:, None]
+    labels = np.full((len(scores), len(cutoffs)), STABLE, dtype=np.int8)
+    labels[scores > cutoffs] = UP
+    labels[scores < -cutoffs] = DOWN
+    labels[np.isnan(scores[:, 0])] = MISSING
+    return labels
+
+
+def threshold_labels(close: np.ndarray, thresholds: Sequence[float], horizon: int = 1) -> np.ndarray:
+    """
+    Label forward returns against a grid of fixed symmetric thresholds.
+
+    Args:
+        close: Price column
+        thresholds: Minimum absolute returns counted as a move, one label column each
+        horizon: Steps ahead the return is measured over
+
+    Returns:
+        int8 array of shape (n_rows, len(thresholds)) with codes DOWN/STABLE/UP, MISSING where unknown
+    """
+    return _classify(forward_returns(close, horizon), np.asarray(thresholds, dtype=np.float64))
+
+
+def volatility_labels(
+    close: np.ndarray,
+    atr: np.ndarray,
+    multipliers: Sequence[float],
+    horizon: int = 1
+) -> np.ndarray:
+    """
+    Label forward returns against thresholds scaled by each row's ATR.
+
+    The threshold of row t is multiplier * ATR_t / close_t, so the returns are
+    normalized by the relative ATR once and compared against the multipliers.
+
+    Args:
+        close: Price column
+        atr: Average true range column aligned with close
+        multipliers: ATR multiples counted as a move, one label column each
+        horizon: Steps ahead the return is measured over
+
+    Returns:
+        int8 array of shape (n_rows, len(multipliers)) with codes DOWN/STABLE/UP, MISSING where unknown
+    """
+    close = np.asarray(close, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = forward_returns(close, horizon) * close / np.asarray(atr, dtype=np.float64)
+    scores[~np.isfinite(scores)] = np.nan
+    return _classify(scores, np.asarray(multipliers, dtype=np.float64))
+
+
+def _first_hit(hits: np.ndarray) -> np.ndarray:
+    # Offset of the first True per row, or the row length when there is none
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), hits.shape[1])
+
+
+def triple_barrier_labels(
+    close: np.ndarray,
+    barriers: Sequence[Tuple[float, float, int]],
+    high: Optional[np.ndarray] = None,
+    low: Optional[np.ndarray] = None,
+    scale: Optional[np.ndarray] = None,
+    block_rows: int = BARRIER_BLOCK_ROWS
+) -> np.ndarray:
+    """
+    Label each row by which barrier its future price path touches first.
+
+    Every row opens a position at its close with an upper barrier at
+    close * (1 + upper * scale), a lower barrier at close * (1 - lower * scale)
+    and a vertical barrier max_holding rows later. The path is taken from the
+    highs and lows when given, otherwise from the closes. A bar touching both
+    barriers is counted as a stop-out. All barrier configurations share one
+    scan of the future path, processed in blocks of rows.
+
+    Args:
+        close: Price column
+        barriers: (upper, lower, max_holding) per label column; widths are fractions of the price
+        high: Optional high column used to detect upper-barrier touches
+        low: Optional low column used to detect lower-barrier touches
+        scale: Optional per-row multiplier of the widths, e.g. the ATR relative to the close
+        block_rows: Rows scanned at once
+
+    Returns:
+        int8 array of shape (n_rows, len(barriers)): UP if the upper barrier is touched
+        first, DOWN if the lower one is, STABLE if neither is touched before the vertical
+        barrier, MISSING if the path ends before any of these happens
+    """
+    close = np.asarray(close, dtype=np.float64)
+    high = close if high is None else np.asarray(high, dtype=np.float64)
+    low = close if low is None else np.asarray(low, dtype=np.float64)
+    scale = np.ones(len(close)) if scale is None else np.asarray(scale, dtype=np.float64)
+
+    n_rows = len(close)
+    labels = np.full((n_rows, len(barriers)), MISSING, dtype=np.int8)
+    if n_rows == 0 or not barriers:
+        return labels
+    max_holding = max(int(holding) for _, _, holding in barriers)
+
+    # Future path of row t is rows t+1 .. t+max_holding; pad the end so every row has a full window
+    padding = np.full(max_holding, np.nan)
+    future_high = sliding_window_view(np.concatenate([high[1:], padding]), max_holding)
+    future_low = sliding_window_view(np.concatenate([low[1:], padding]), max_holding)
+    remaining = n_rows - 1 - np.arange(n_rows)
+
+    for start in range(0, n_rows, block_rows):
+        stop = min(start + block_rows, n_rows)
+        entry = close[start:stop, None]
+        up_moves = future_high[start:stop] / entry - 1.0
+        down_moves = 1.0 - future_low[start:stop] / entry
+        width = scale[start:stop]
+        known = ~(np.isnan(close[start:stop]) | np.isnan(width))
+
+        for k, (upper, lower, holding) in enumerate(barriers):
+            holding = int(holding)
+            t_up = _first_hit(up_moves[:, :holding] >= (upper * width)[:, None])
+            t_down = _first_hit(down_moves[:, :holding] >= (lower * width)[:, None])
+            column = np.full(stop - start, MISSING, dtype=np.int8)
+            # Neither touched: only a label if the vertical barrier lies within the data
+            column[remaining[start:stop] >= holding] = STABLE
+            column[t_up < t_down] = UP
+            column[(t_down <= t_up) & (t_down < holding)] = DOWN
+            column[~known] = MISSING
+            labels[start:stop, k] = column
+    return labels
+
+
+def label_matrix(
+    data: pd.DataFrame,
+    thresholds: Sequence[float] = (),
+    atr_multipliers: Sequence[float] = (),
+    barriers: Sequence[Tuple[float, float, int]] = (),
+    horizon: int = 1,
+    scale_barriers: bool = False
+) -> pd.DataFrame:
+    """
+    Compute labels for a whole grid of label definitions in one call.
+
+    The ATR is taken from the frame when present and computed from the
+    registry otherwise (only if an ATR-based definition is requested).
+
+    Args:
+        data: Frame with a 'Close' column, plus 'High' and 'Low' for ATR-based labels
+        thresholds: Fixed return thresholds, one column 'threshold_<t>' each
+        atr_multipliers: ATR multiples, one column 'atr_<m>' each
+        barriers: (upper, lower, max_holding) triple-barrier settings, one column
+            'barrier_<upper>_<lower>_<max_holding>' each
+        horizon: Steps ahead for the threshold and ATR labels
+        scale_barriers: Whether the barrier widths are ATR multiples instead of price fractions
+
+    Returns:
+        DataFrame of int8 labels over one contiguous block, indexed like data
+    """
+    close = data['Close'].to_numpy(dtype=np.float64)
+    high = data['High'].to_numpy(dtype=np.float64) if 'High' in data.columns else None
+    low = data['Low'].to_numpy(dtype=np.float64) if 'Low' in data.columns else None
+
+    atr = None
+    if len(atr_multipliers) or (len(barriers) and scale_barriers):
+        if 'ATR' in data.columns:
+            atr = data['ATR'].to_numpy(dtype=np.float64)
+        else:
+            atr = compute_indicators(data, indicators=['ATR'])[0]['ATR'].to_numpy(dtype=np.float64)
+
+    names: List[str] = []
+    labels = np.empty((len(data), len(thresholds) + len(atr_multipliers) + len(barriers)), dtype=np.int8)
+    column = 0
+    if len(thresholds):
+        labels[:, column:column + len(thresholds)] = threshold_labels(close, thresholds, horizon)
+        names += [f'threshold_{t:g}' for t in thresholds]
+        column += len(thresholds)
+    if len(atr_multipliers):
+        labels[:, column:column + len(atr_multipliers)] = volatility_labels(close, atr, atr_multipliers, horizon)
+        names += [f'atr_{m:g}' for m in atr_multipliers]
+        column += len(atr_multipliers)
+    if len(barriers):
+        scale = atr / close if scale_barriers else None
+        labels[:, column:] = triple_barrier_labels(close, barriers, high=high, low=low, scale=scale)
+        names += [f'barrier_{u:g}_{d:g}_{int(h)}' for u, d, h in barriers]
+
+    return pd.DataFrame(labels, index=data.index, columns=names, copy=False)
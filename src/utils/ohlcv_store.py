@@ -0,0 +1,222 @@
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+# Half-open [start, end) date interval, matching yf.download's exclusive end
+Interval = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+def normalize_date(value) -> pd.Timestamp:
+    """
+    Convert a date-like value to a tz-naive midnight timestamp.
+
+    Args:
+        value: Date, datetime, string or Timestamp
+
+    Returns:
+        Normalized Timestamp
+    """
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """
+    Coalesce overlapping or touching intervals.
+
+    Args:
+        intervals: List of (start, end) intervals
+
+    Returns:
+        Sorted list of disjoint intervals
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(i for i in intervals if i[0] < i[1]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(start: pd.Timestamp, end: pd.Timestamp, covered: List[Interval]) -> List[Interval]:
+    """
+    Find the parts of [start, end) that are not covered.
+
+    Args:
+        start: Start of the requested range
+        end: End of the requested range (exclusive)
+        covered: Disjoint, sorted list of covered intervals
+
+    Returns:
+        List of uncovered (start, end) intervals
+    """
+    gaps: List[Interval] = []
+    cursor = start
+    for cov_start, cov_end in covered:
+        if cov_end <= cursor:
+            continue
+        if cov_start >= end:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, min(cov_start, end)))
+        cursor = max(cursor, cov_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class OHLCVStore:
+    def __init__(self, root_dir: str):
+        """
+        Initialize a persistent on-disk store of daily OHLCV data.
+
+        Each symbol is kept in its own Parquet file, and a JSON manifest
+        records which date intervals have already been downloaded. The
+        directory is only created by the first write.
+
+        Args:
+            root_dir: Directory holding the Parquet files and manifest
+        """
+        self.root_dir = root_dir
+        self.manifest_path = os.path.join(root_dir, 'manifest.json')
+        self.manifest = self._read_manifest()
+        self._lock = threading.RLock()  # Serializes writes from prefetch threads
+
+    def _read_manifest(self) -> dict:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            # A corrupt manifest only costs a re-download
+            return {}
+        return {
+            symbol: [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in intervals]
+            for symbol, intervals in raw.items()
+        }
+
+    def _write_manifest(self) -> None:
+        raw = {
+            symbol: [[s.isoformat(), e.isoformat()] for s, e in intervals]
+            for symbol, intervals in self.manifest.items()
+        }
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(raw, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _symbol_path(self, symbol: str) -> str:
+        safe_symbol = re.sub(r'[^A-Za-z0-9._-]', '_', symbol)
+        return os.path.join(self.root_dir, f"{safe_symbol}.parquet")
+
+    def coverage(self, symbol: str) -> List[Interval]:
+        """
+        Get the date intervals stored for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Sorted list of disjoint covered intervals
+        """
+        with self._lock:
+            return list(self.manifest.get(symbol, []))
+
+    def missing_intervals(self, symbol: str, start_date: datetime, end_date: datetime) -> List[Interval]:
+        """
+        Get the parts of a date range that are not stored yet.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start of the requested range
+            end_date: End of the requested range (exclusive)
+
+        Returns:
+            List of (start, end) intervals that still need downloading
+        """
+        return subtract_intervals(
+            normalize_date(start_date),
+            normalize_date(end_date),
+            self.coverage(symbol)
+        )
+
+    def read(self, symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Read stored rows of a symbol within a date range.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start of the range
+            end_date: End of the range (exclusive)
+
+        Returns:
+            DataFrame indexed by date (empty if nothing is stored)
+        """
+        path = self._symbol_path(symbol)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+
+        start, end = normalize_date(start_date), normalize_date(end_date)
+        data = pd.read_parquet(path, filters=[('Date', '>=', start), ('Date', '<', end)])
+        return data.sort_index()
+
+    def write(self, symbol: str, data: pd.DataFrame, start_date: datetime, end_date: datetime) -> None:
+        """
+        Merge downloaded rows into the store and mark their range as covered.
+
+        Args:
+            symbol: Stock symbol
+            data: Downloaded rows indexed by date (may be empty)
+            start_date: Start of the downloaded range
+            end_date: End of the downloaded range (exclusive)
+        """
+        with self._lock:
+            self._write(symbol, data, start_date, end_date)
+
+    def _write(self, symbol: str, data: pd.DataFrame, start_date: datetime, end_date: datetime) -> None:
+        os.makedirs(self.root_dir, exist_ok=True)
+        path = self._symbol_path(symbol)
+        if not data.empty:
+            if os.path.exists(path):
+                existing = pd.read_parquet(path)
+                data = pd.concat([existing, data])
+                data = data[~data.index.duplicated(keep='last')]
+            data = data.sort_index()
+            data.index.name = 'Date'
+
+            tmp_path = path + '.tmp'
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+
+        intervals = self.manifest.get(symbol, []) + [(normalize_date(start_date), normalize_date(end_date))]
+        self.manifest[symbol] = merge_intervals(intervals)
+        self._write_manifest()
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """
+        Remove stored data for one symbol, or for all symbols.
+
+        Args:
+            symbol: Symbol to remove (if None, removes everything)
+        """
+        with self._lock:
+            symbols = [symbol] if symbol is not None else list(self.manifest)
+            for sym in symbols:
+                path = self._symbol_path(sym)
+                if os.path.exists(path):
+                    os.remove(path)
+                self.manifest.pop(sym, None)
+            # Nothing to remove means nothing was ever written, possibly not even the directory
+            if symbols:
+                self._write_manifest()
@@ -0,0 +1,233 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .ohlcv_store import normalize_date
+
+# Marks the prefetch worker threads, whose downloads yield to foreground ones
+_background = threading.local()
+
+
+class DownloadGate:
+    def __init__(self):
+        """
+        Initialize a gate letting one download through at a time.
+
+        Foreground downloads (any thread that is not a prefetch worker) go
+        before background ones: a background download only starts while no
+        foreground download is waiting, so a user's request never queues
+        behind a backlog of prefetches.
+        """
+        self._condition = threading.Condition()
+        self._busy = False
+        self._foreground_waiting = 0
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """
+        Block until this thread's turn, and hold the gate for the duration of the block.
+        """
+        background = getattr(_background, 'active', False)
+        with self._condition:
+            if not background:
+                self._foreground_waiting += 1
+            try:
+                while self._busy or (background and self._foreground_waiting):
+                    self._condition.wait()
+            finally:
+                if not background:
+                    self._foreground_waiting -= 1
+            self._busy = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+
+class Prefetcher:
+    def __init__(self, loader, max_workers: int = 4):
+        """
+        Initialize a background prefetcher that warms a DataLoader's cache.
+
+        Args:
+            loader: DataLoader whose load_many is used to fetch data
+            max_workers: Maximum number of date windows prefetched concurrently
+                (each window is one batched download of all its symbols)
+        """
+        self.loader = loader
+        self.max_workers = max_workers
+        self.errors: Dict[str, str] = {}  # symbol -> last error message
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # owner -> (cancel event, futures) of the owner's latest prefetch
+        self._tasks: Dict[Any, Tuple[threading.Event, List[Future]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='pff-prefetch'
+            )
+        return self._executor
+
+    @staticmethod
+    def _windows(
+        start_date: datetime,
+        end_date: datetime,
+        adjacent_windows: int
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Get the current date window followed by adjacent windows of the same length.
+
+        Windows alternate between later and earlier ranges, nearest first;
+        windows that start in the future are skipped.
+
+        Args:
+            start_date: Start of the current window
+            end_date: End of the current window
+            adjacent_windows: Number of windows on each side
+
+        Returns:
+            List of (start, end) windows
+        """
+        start, end = normalize_date(start_date), normalize_date(end_date)
+        length = max(end - start, pd.Timedelta(days=1))
+        today = normalize_date(datetime.now())
+
+        windows = [(start, end)]
+        for i in range(1, adjacent_windows + 1):
+            later_start = start + i * length
+            if later_start < today:
+                windows.append((later_start, min(later_start + length, today)))
+            windows.append((start - i * length, end - i * length))
+        return windows
+
+    def _run(
+        self,
+        symbols: List[str],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        cancel_event: threading.Event
+    ) -> None:
+        if cancel_event.is_set():
+            return
+        _background.active = True
+        try:
+            # One batched request per window; cached and stored symbols are not downloaded
+            loaded = self.loader.load_many(symbols, start, end)
+            failed = {
+                symbol: f"No data found for symbol {symbol}" for symbol in symbols if symbol not in loaded
+            }
+        except Exception as e:
+            # Isolate failures so one bad window does not affect the others
+            failed = {symbol: str(e) for symbol in symbols}
+        finally:
+            _background.active = False
+
+        with self._lock:
+            for symbol in symbols:
+                if symbol in failed:
+                    self.errors[symbol] = failed[symbol]
+                else:
+                    self.errors.pop(symbol, None)
+
+    def prefetch(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        adjacent_windows: int = 1,
+        owner: Any = None
+    ) -> None:
+        """
+        Warm the cache for symbols over a date window and its neighbours.
+
+        Any prefetch still pending from the same owner is cancelled first,
+        since that user has moved on to a new selection; other owners'
+        prefetches are left alone.
+
+        Args:
+            symbols: Stock symbols to prefetch
+            start_date: Start of the current date window
+            end_date: End of the current date window
+            adjacent_windows: Number of same-length windows to prefetch on each side
+            owner: Hashable key of the caller (e.g. one per user session)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return
+        self.cancel(owner)
+        cancel_event = threading.Event()
+        executor = self._get_executor()
+
+        # Submitted nearest window first, so the current range is fetched before the others
+        futures = [
+            executor.submit(self._run, symbols, start, end, cancel_event)
+            for start, end in self._windows(start_date, end_date, adjacent_windows)
+        ]
+
+        with self._lock:
+            self._tasks[owner] = (cancel_event, futures)
+
+    def cancel(self, owner: Any = None) -> None:
+        """
+        Cancel an owner's pending prefetch tasks; downloads already running are allowed to finish.
+
+        Args:
+            owner: Key passed to prefetch
+        """
+        with self._lock:
+            task = self._tasks.pop(owner, None)
+        if task is not None:
+            cancel_event, futures = task
+            cancel_event.set()
+            for future in futures:
+                future.cancel()
+
+    def cancel_all(self) -> None:
+        """
+        Cancel the pending prefetch tasks of every owner.
+        """
+        with self._lock:
+            owners = list(self._tasks)
+        for owner in owners:
+            self.cancel(owner)
+
+    def _futures(self) -> List[Future]:
+        with self._lock:
+            return [future for _, futures in self._tasks.values() for future in futures]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the current prefetch tasks of all owners have finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait (if None, waits indefinitely)
+
+        Returns:
+            True if all tasks finished, False on timeout
+        """
+        _, not_done = wait(self._futures(), timeout=timeout)
+        return not not_done
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of prefetch tasks that have not finished yet.
+        """
+        return sum(not future.done() for future in self._futures())
+
+    def shutdown(self) -> None:
+        """
+        Cancel pending tasks and stop the worker threads.
+        """
+        self.cancel_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,81 @@
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Picklable description of a shared array: (segment name, shape, dtype string)
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+class SharedArray:
+    def __init__(self, array: np.ndarray):
+        """
+        Copy an array into a new shared memory segment.
+
+        Worker processes attach to the segment by its spec instead of
+        receiving a pickled copy of the data, so every worker reads the
+        same physical pages. The creating process owns the segment and
+        must release it with close() (or by using the object as a context
+        manager).
+
+        Args:
+            array: Array to share
+        """
+        array = np.ascontiguousarray(array)
+        # Zero-size segments are not allowed; a one-byte segment backs empty arrays
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)
+        self.array[...] = array
+        self.spec: ArraySpec = (self._shm.name, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        """
+        Release the segment; views of it must not be used afterwards.
+        """
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> 'SharedArray':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python 3.13+: attaching processes must not unlink the owner's segment on exit
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# Segments attached by this process, kept open for the lifetime of the process
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def attach_array(spec: Optional[ArraySpec]) -> Optional[np.ndarray]:
+    """
+    Get a read-only view of a shared array created in another process.
+
+    Segments stay attached until the process exits, so repeated calls for
+    the same spec (e.g. one per task in a worker pool) map it only once.
+
+    Args:
+        spec: Spec of a SharedArray, or None
+
+    Returns:
+        Read-only array backed by the shared segment, or None if spec is None
+    """
+    if spec is None:
+        return None
+    name, shape, dtype = spec
+    if name not in _attached:
+        _attached[name] = _open_segment(name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attached[name].buf)
+    array.flags.writeable = False
+    return array
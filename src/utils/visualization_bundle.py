@@ -0,0 +1,77 @@
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from .frame_cache import freeze_frame
+
+
+class VisualizationBundle(Mapping):
+    def __init__(self, frame: pd.DataFrame, groups: Dict[str, List[str]]):
+        """
+        Initialize a lazy, read-only mapping of visualization data.
+
+        Members are built on first access and kept afterwards: column groups
+        are frames viewing the columns of the shared frame without copying,
+        and 'correlation_data' is the correlation matrix of all numeric columns.
+        Every access returns a shallow copy of the member, so the bundle can be
+        shared between callers.
+
+        Args:
+            frame: Frozen frame holding every column the groups refer to
+            groups: Member name -> column names; groups with missing columns are left out
+        """
+        self.frame = frame
+        self.groups = {
+            name: columns for name, columns in groups.items()
+            if all(col in frame.columns for col in columns)
+        }
+        self._members: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def _view(self, columns: List[str]) -> pd.DataFrame:
+        # Frames built from a dict of arrays with copy=False keep the column
+        # buffers, so a group costs no memory beyond its index reference
+        arrays = {col: self.frame[col].to_numpy() for col in columns}
+        return pd.DataFrame(arrays, index=self.frame.index, copy=False)
+
+    def _correlation(self) -> pd.DataFrame:
+        numeric_cols = self.frame.select_dtypes(include=[np.number]).columns
+        return freeze_frame(self.frame[numeric_cols].corr().astype('float32'))
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        with self._lock:
+            if name not in self._members:
+                if name == 'correlation_data':
+                    self._members[name] = self._correlation()
+                elif name in self.groups:
+                    self._members[name] = self._view(self.groups[name])
+                else:
+                    raise KeyError(name)
+            # Members are shared by every holder of the bundle; callers get their own
+            # frame object, so adding or replacing columns stays local to them
+            return self._members[name].copy(deep=False)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.groups) + ['correlation_data'])
+
+    def __len__(self) -> int:
+        return len(self.groups) + 1
+
+    def is_computed(self, name: str) -> bool:
+        """
+        Check whether a member has been built already.
+
+        Args:
+            name: Member name
+
+        Returns:
+            True if the member was accessed before
+        """
+        with self._lock:
+            return name in self._members
+
+    def __repr__(self) -> str:
+        return f"VisualizationBundle({list(self)})"
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.backtesting import WalkForwardBacktester, walk_forward_splits
+from src.models.classification import LogisticRegressionModel
+from src.models.clustering import KMeansModel
+from src.models.regression import LinearRegressionModel
+from src.utils.data_loader import DataLoader
+
+MODELS = {
+    'regression': LinearRegressionModel,
+    'classification': LogisticRegressionModel,
+    'clustering': KMeansModel
+}
+
+
+def trending_data(n_rows: int = 500, seed: int = 0) -> pd.DataFrame:
+    # A random walk with a strong drift, so later test blocks sit far from earlier ones
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.5, 1.0, n_rows))
+    spread = np.abs(rng.normal(0.0, 0.5, n_rows))
+    return pd.DataFrame(
+        {
+            'Open': close + rng.normal(0.0, 0.1, n_rows),
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000, 1_000_000, n_rows).astype('float64')
+        },
+        index=pd.date_range('2020-01-01', periods=n_rows, freq='D', name='Date')
+    )
+
+
+@pytest.mark.parametrize('analysis_type', list(MODELS))
+def test_trending_series_is_scored_for_every_model_type(analysis_type):
+    X, y, _ = DataLoader(prefetch_workers=1).prepare_ml_data(trending_data(), analysis_type=analysis_type)
+    model = MODELS[analysis_type](random_state=0) if analysis_type == 'clustering' else MODELS[analysis_type]()
+
+    backtest = WalkForwardBacktester(model, n_folds=5, max_workers=1).run(
+        X, y if analysis_type != 'clustering' else None
+    )
+
+    assert len(backtest['folds']) == 5
+    assert backtest['mean']
+    for name, value in backtest['mean'].items():
+        assert np.isfinite(value), name
+        assert np.isfinite(backtest['std'][name]), name
+
+
+def test_unscorable_folds_are_nan_and_skipped_in_the_aggregates():
+    # Two well separated regimes: the test blocks of the second one hold a single cluster
+    rng = np.random.default_rng(1)
+    X = np.concatenate([rng.normal(0.0, 1.0, (300, 2)), rng.normal(50.0, 1.0, (300, 2))])
+
+    backtest = WalkForwardBacktester(KMeansModel(n_clusters=2, random_state=0), n_folds=5, max_workers=1).run(X)
+
+    silhouettes = backtest['folds']['silhouette']
+    assert silhouettes.isna().any() and silhouettes.notna().any()
+    assert backtest['mean']['silhouette'] == pytest.approx(silhouettes.mean())
+    assert backtest['std']['silhouette'] == pytest.approx(silhouettes.std(ddof=0))
+
+
+def test_parallel_run_matches_in_process_run():
+    X, y, _ = DataLoader(prefetch_workers=1).prepare_ml_data(trending_data(seed=2))
+    in_process = WalkForwardBacktester(LinearRegressionModel(), n_folds=3, max_workers=1).run(X, y)
+    parallel = WalkForwardBacktester(LinearRegressionModel(), n_folds=3, max_workers=2).run(X, y)
+    pd.testing.assert_frame_equal(parallel['folds'], in_process['folds'])
+
+
+def test_walk_forward_splits_keep_training_before_the_gap():
+    folds = walk_forward_splits(100, n_folds=3, gap=2)
+    assert folds == [(0, 23, 25, 50), (0, 48, 50, 75), (0, 73, 75, 100)]
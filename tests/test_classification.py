@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from src.models.classification import LogisticRegressionModel
+
+
+def make_data(n_rows: int = 600, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 4))
+    # Three classes per target, each driven by a different feature
+    Y = np.column_stack([np.digitize(X[:, 0], [-0.5, 0.5]), np.digitize(X[:, 2], [-0.5, 0.5])])
+    return X, Y
+
+
+def test_multi_output_feature_importance_averages_the_targets():
+    X, Y = make_data()
+    names = ['a', 'b', 'c', 'd']
+    model = LogisticRegressionModel()
+    model.train(X, Y, feature_names=names)
+
+    importance = model.get_feature_importance()
+
+    per_target = []
+    for k in range(Y.shape[1]):
+        single = LogisticRegressionModel()
+        single.train(X, Y[:, k], feature_names=names)
+        per_target.append(single.get_feature_importance())
+    expected = pd.concat(per_target, axis=1).mean(axis=1)
+    pd.testing.assert_series_equal(importance, expected, rtol=1e-6)
+    assert set(importance.nlargest(2).index) == {'a', 'c'}
@@ -0,0 +1,83 @@
+import io
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.data_loader import DataLoader
+from src.utils.dataset_reader import iter_dataset_chunks, read_csv_chunked
+
+
+def csv_upload(data: pd.DataFrame, name: str = 'data.csv') -> io.BytesIO:
+    upload = io.BytesIO(data.to_csv(index=False).encode())
+    upload.name = name
+    return upload
+
+
+@pytest.mark.parametrize('later_value', ['', '7'])
+def test_category_column_with_empty_or_numeric_looking_later_chunks(later_value):
+    n_rows = 3000
+    sector = np.array(['Tech', 'Energy', 'Retail'] * (n_rows // 3), dtype=object)
+    sector[1000:] = later_value
+    data = pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=n_rows).strftime('%Y-%m-%d'),
+        'Sector': sector,
+        'Close': np.arange(n_rows, dtype='float64')
+    })
+
+    result = read_csv_chunked(csv_upload(data), chunk_rows=1000)
+
+    assert isinstance(result['Sector'].dtype, pd.CategoricalDtype)
+    expected = pd.Series(sector).replace('', np.nan)
+    pd.testing.assert_series_equal(result['Sector'].astype(object), expected.astype(object), check_names=False)
+
+    chunks = list(iter_dataset_chunks(csv_upload(data), chunk_rows=1000))
+    assert len({str(chunk['Sector'].cat.categories.dtype) for chunk in chunks}) == 1
+
+
+def test_parquet_column_projection_keeps_the_date_index(tmp_path):
+    path = str(tmp_path / 'prices.parquet')
+    data = pd.DataFrame(
+        {'Open': np.arange(10.0), 'Close': np.arange(10.0) + 0.5},
+        index=pd.date_range('2020-01-01', periods=10, name='Date')
+    )
+    data.to_parquet(path)
+    loader = DataLoader(prefetch_workers=1)
+
+    full = loader.load_kragle_dataset(path)
+    projected = loader.load_kragle_dataset(path, columns=['Close'])
+    with open(path, 'rb') as f:
+        upload = io.BytesIO(f.read())
+    upload.name = 'prices.parquet'
+    uploaded = loader.load_kragle_dataset(upload, columns=['Close'])
+
+    for frame in (projected, uploaded):
+        assert list(frame.columns) == ['Close']
+        pd.testing.assert_index_equal(frame.index, full.index)
+    chunks = list(iter_dataset_chunks(path, chunk_rows=4, columns=['Close']))
+    pd.testing.assert_index_equal(pd.concat(chunks).index, full.index)
+
+
+def test_undated_npy_rejects_date_ranges(tmp_path):
+    path = str(tmp_path / 'prices.npy')
+    np.save(path, np.arange(20, dtype='float32').reshape(10, 2))
+    loader = DataLoader(prefetch_workers=1)
+
+    data = loader.load_local_dataset(path, columns=['Open', 'Close'])
+    assert len(data) == 10 and list(data.columns) == ['Open', 'Close']
+    with pytest.raises(ValueError, match='no Date column'):
+        loader.load_local_dataset(path, start_date=datetime(2020, 1, 1), columns=['Open', 'Close'])
+
+
+def test_structured_npy_selects_date_ranges(tmp_path):
+    path = str(tmp_path / 'prices.npy')
+    array = np.zeros(10, dtype=[('Date', 'datetime64[ns]'), ('Close', 'float32')])
+    array['Date'] = pd.date_range('2020-01-01', periods=10).to_numpy()
+    array['Close'] = np.arange(10)
+    np.save(path, array)
+
+    data = DataLoader(prefetch_workers=1).load_local_dataset(
+        path, start_date=datetime(2020, 1, 3), end_date=datetime(2020, 1, 6)
+    )
+    assert list(data['Close']) == [2.0, 3.0, 4.0]
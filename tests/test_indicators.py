@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.data_loader import DataLoader
+from src.utils.indicators import INDICATOR_COLUMNS, IndicatorState, compute_indicators
+
+
+def pandas_indicators(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reference: the chained pandas rolling/ewm implementation the kernel replaced.
+    """
+    df = data.astype('float32')
+
+    df['SMA_20'] = df['Close'].rolling(window=20).mean().astype('float32')
+    df['SMA_50'] = df['Close'].rolling(window=50).mean().astype('float32')
+    df['EMA_20'] = df['Close'].ewm(span=20, adjust=False).mean().astype('float32')
+    df['EMA_50'] = df['Close'].ewm(span=50, adjust=False).mean().astype('float32')
+
+    delta = df['Close'].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=14).mean() / loss.rolling(window=14).mean()
+    df['RSI'] = (100 - (100 / (1 + rs))).astype('float32')
+
+    ema12 = df['Close'].ewm(span=12, adjust=False).mean()
+    ema26 = df['Close'].ewm(span=26, adjust=False).mean()
+    df['MACD'] = (ema12 - ema26).astype('float32')
+    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean().astype('float32')
+
+    bb_middle = df['Close'].rolling(window=20).mean()
+    bb_std = df['Close'].rolling(window=20).std()
+    df['BB_Middle'] = bb_middle.astype('float32')
+    df['BB_Upper'] = (bb_middle + (2.0 * bb_std)).astype('float32')
+    df['BB_Lower'] = (bb_middle - (2.0 * bb_std)).astype('float32')
+
+    high_low = df['High'] - df['Low']
+    high_close = np.abs(df['High'] - df['Close'].shift())
+    low_close = np.abs(df['Low'] - df['Close'].shift())
+    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    df['ATR'] = true_range.rolling(window=14).mean().astype('float32')
+
+    df['OBV'] = (np.sign(df['Close'].diff()) * df['Volume']).fillna(0).cumsum().astype('float32')
+
+    return df.bfill().ffill().astype('float32')
+
+
+def make_data(n_rows: int, seed: int = 0, start: str = '2020-01-01') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.5, n_rows))
+    spread = np.abs(rng.normal(0.0, 0.5, n_rows))
+    return pd.DataFrame(
+        {
+            'Open': close + rng.normal(0.0, 0.1, n_rows),
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000, 1_000_000, n_rows).astype('float64')
+        },
+        index=pd.date_range(start, periods=n_rows, freq='D', name='Date')
+    )
+
+
+def assert_frames_close(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    assert list(actual.columns) == list(expected.columns)
+    assert actual.index.equals(expected.index)
+    # float32 results; OBV is a running total and is compared relative to its scale.
+    # NaN must match too: a window longer than the series stays all-NaN after filling
+    for col in expected.columns:
+        scale = max(float(np.nan_to_num(np.abs(expected[col])).max()), 1.0)
+        np.testing.assert_allclose(actual[col], expected[col], rtol=1e-4, atol=1e-5 * scale, err_msg=col)
+
+
+@pytest.fixture
+def loader():
+    return DataLoader(prefetch_workers=1)
+
+
+@pytest.mark.parametrize('n_rows', [5, 30, 60, 500])
+def test_kernel_matches_pandas(loader, n_rows):
+    data = make_data(n_rows)
+    assert_frames_close(loader.calculate_technical_indicators(data), pandas_indicators(data))
+
+
+def test_kernel_with_missing_values_matches_pandas(loader):
+    data = make_data(300)
+    data.iloc[[0, 40, 41, 150], data.columns.get_loc('Close')] = np.nan
+    data.iloc[[10, 200], data.columns.get_loc('Volume')] = np.nan
+    assert_frames_close(loader.calculate_technical_indicators(data), pandas_indicators(data))
+
+
+def test_compute_indicators_subset_matches_full_set():
+    data = make_data(200).astype('float32')
+    full, _ = compute_indicators(data, fill_nans=True)
+    subset, _ = compute_indicators(data, indicators=['ATR', 'Signal_Line'], fill_nans=True)
+    np.testing.assert_array_equal(subset.to_numpy(), full[['ATR', 'Signal_Line']].to_numpy())
+
+
+@pytest.mark.parametrize('first_rows', [10, 30, 49, 50, 51, 200])
+def test_incremental_bar_by_bar_matches_full_recompute(loader, first_rows):
+    data = make_data(260)
+    state = IndicatorState()
+    loader.calculate_technical_indicators(data.iloc[:first_rows], state=state)
+    for end in range(first_rows + 1, len(data) + 1):
+        result = loader.calculate_technical_indicators(data.iloc[:end], state=state)
+
+    assert_frames_close(result, pandas_indicators(data))
+
+
+def test_incremental_chunks_match_full_recompute(loader):
+    data = make_data(1000)
+    state = IndicatorState()
+    for end in (100, 101, 350, 351, 352, 1000):
+        result = loader.calculate_technical_indicators(data.iloc[:end], state=state)
+        assert_frames_close(result, pandas_indicators(data.iloc[:end]))
+
+
+def test_incremental_results_are_not_rewritten(loader):
+    data = make_data(300)
+    state = IndicatorState()
+    first = loader.calculate_technical_indicators(data.iloc[:200], state=state)
+    snapshot = first.copy()
+    second = loader.calculate_technical_indicators(data.iloc[:250], state=state)
+    second['Extra'] = 1.0
+    loader.calculate_technical_indicators(data, state=state)
+
+    pd.testing.assert_frame_equal(first, snapshot)
+    assert 'Extra' not in state.result.columns
+
+
+def test_incremental_with_missing_values_matches_full_recompute(loader):
+    data = make_data(300)
+    data.iloc[[120, 205, 206], data.columns.get_loc('Close')] = np.nan
+    state = IndicatorState()
+    loader.calculate_technical_indicators(data.iloc[:100], state=state)
+    for end in range(101, len(data) + 1):
+        result = loader.calculate_technical_indicators(data.iloc[:end], state=state)
+
+    assert_frames_close(result, pandas_indicators(data))
+
+
+def test_revised_last_bar_triggers_full_recompute(loader):
+    data = make_data(300)
+    state = IndicatorState()
+    loader.calculate_technical_indicators(data.iloc[:200], state=state)
+    revised = data.copy()
+    revised.iloc[199, revised.columns.get_loc('Close')] += 5.0
+    result = loader.calculate_technical_indicators(revised, state=state)
+    assert_frames_close(result, pandas_indicators(revised))
+
+
+def test_panel_matches_per_symbol(loader):
+    # Symbols of different lengths, one shorter than the longest window
+    symbols = {'AAA': make_data(300, seed=1), 'BBB': make_data(40, seed=2), 'CCC': make_data(120, seed=3)}
+    symbols['CCC'].iloc[5, symbols['CCC'].columns.get_loc('Close')] = np.nan
+    panel = pd.concat(symbols, names=['Symbol', 'Date'])
+
+    result = loader.calculate_technical_indicators(panel)
+    for symbol, data in symbols.items():
+        assert_frames_close(result.loc[symbol], pandas_indicators(data))
+
+
+def test_long_format_panel_matches_per_symbol(loader):
+    symbols = {'AAA': make_data(80, seed=4), 'BBB': make_data(80, seed=5, start='2020-02-01')}
+    long_format = pd.concat(
+        [data.assign(Symbol=symbol) for symbol, data in symbols.items()]
+    ).sort_index(kind='stable')
+
+    result = loader.calculate_technical_indicators(long_format)
+    for symbol, data in symbols.items():
+        rows = result[result['Symbol'] == symbol].drop(columns='Symbol')
+        assert_frames_close(rows, pandas_indicators(data))
+
+
+def test_memoized_result_is_not_shared(loader):
+    data = make_data(100)
+    first = loader.calculate_technical_indicators(data)
+    first['Signal'] = 1.0
+    second = loader.calculate_technical_indicators(data)
+    assert 'Signal' not in second.columns
+    assert list(second.columns) == list(data.columns) + INDICATOR_COLUMNS
@@ -0,0 +1,82 @@
+import threading
+import time
+from datetime import datetime
+
+from src.utils import prefetcher as prefetcher_module
+from src.utils.prefetcher import DownloadGate, Prefetcher
+
+
+class RecordingLoader:
+    def __init__(self, release: threading.Event = None):
+        self.calls = []
+        self.release = release
+
+    def load_many(self, symbols, start, end):
+        self.calls.append((tuple(symbols), start, end))
+        if self.release is not None:
+            self.release.wait(5)
+        return {symbol: None for symbol in symbols if symbol != 'BAD'}
+
+
+def test_each_window_is_one_batched_load():
+    loader = RecordingLoader()
+    prefetcher = Prefetcher(loader, max_workers=2)
+    prefetcher.prefetch(['AAA', 'BBB', 'BAD', 'AAA'], datetime(2020, 3, 1), datetime(2020, 4, 1))
+    assert prefetcher.wait(5)
+    prefetcher.shutdown()
+
+    assert len(loader.calls) == 3
+    assert all(symbols == ('AAA', 'BBB', 'BAD') for symbols, _, _ in loader.calls)
+    assert set(prefetcher.errors) == {'BAD'}
+
+
+def test_a_new_prefetch_only_cancels_the_same_owner():
+    release = threading.Event()
+    loader = RecordingLoader(release)
+    prefetcher = Prefetcher(loader, max_workers=1)
+    window = (datetime(2020, 3, 1), datetime(2020, 4, 1))
+
+    # The single worker is busy with the first window; the rest stay queued
+    prefetcher.prefetch(['AAA'], *window, adjacent_windows=2, owner='first')
+    prefetcher.prefetch(['BBB'], *window, adjacent_windows=0, owner='second')
+    prefetcher.prefetch(['CCC'], *window, adjacent_windows=0, owner='first')
+    release.set()
+    assert prefetcher.wait(5)
+    prefetcher.shutdown()
+
+    loaded = [symbols for symbols, _, _ in loader.calls]
+    assert loaded == [('AAA',), ('BBB',), ('CCC',)]
+
+
+def test_foreground_downloads_go_before_queued_background_ones():
+    gate = DownloadGate()
+    order = []
+    holding, release = threading.Event(), threading.Event()
+
+    def first():
+        with gate.hold():
+            holding.set()
+            release.wait(5)
+
+    def background():
+        prefetcher_module._background.active = True
+        with gate.hold():
+            order.append('background')
+
+    def foreground():
+        with gate.hold():
+            order.append('foreground')
+
+    threads = [threading.Thread(target=first)]
+    threads[0].start()
+    holding.wait(5)
+    # The background download queues first, the foreground one arrives later
+    for target in (background, foreground):
+        threads.append(threading.Thread(target=target))
+        threads[-1].start()
+        time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ['foreground', 'background']
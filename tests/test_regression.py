@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from src.models.regression import LinearRegressionModel
+
+
+def make_data(n_rows: int = 3000, n_features: int = 6, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features)) * rng.uniform(0.1, 100, n_features) + rng.uniform(-1e3, 1e3, n_features)
+    y = X @ rng.normal(size=n_features) + rng.normal(size=n_rows)
+    return X, y
+
+
+def full_refit(X, y):
+    model = LinearRegressionModel()
+    model.train(X, y)
+    return model
+
+
+@pytest.mark.parametrize('n_new', [1, 5, 100])
+def test_train_then_partial_fit_matches_full_refit(n_new):
+    X, y = make_data()
+    n_history = len(X) - n_new
+
+    model = LinearRegressionModel()
+    model.train(X[:n_history], y[:n_history])
+    model.partial_fit(X[n_history:], y[n_history:])
+
+    reference = full_refit(X, y)
+    assert model.n_samples_seen == len(X)
+    np.testing.assert_allclose(model.predict(X), reference.predict(X), rtol=1e-9, atol=1e-7)
+    np.testing.assert_allclose(model.scaler.mean_, reference.scaler.mean_)
+    np.testing.assert_allclose(model.scaler.scale_, reference.scaler.scale_)
+
+
+def test_bar_by_bar_updates_match_full_refit():
+    X, y = make_data()
+    model = LinearRegressionModel()
+    model.train(X[:2900], y[:2900])
+    for row in range(2900, len(X)):
+        model.partial_fit(X[row:row + 1], y[row:row + 1])
+
+    np.testing.assert_allclose(model.predict(X), full_refit(X, y).predict(X), rtol=1e-9, atol=1e-7)
+
+
+def test_partial_fit_chunks_match_full_refit_multi_output():
+    X, y = make_data()
+    Y = np.column_stack([y, 2 * y + 1])
+    model = LinearRegressionModel()
+    for start in range(0, len(X), 700):
+        model.partial_fit(X[start:start + 700], Y[start:start + 700])
+
+    reference = full_refit(X, Y)
+    np.testing.assert_allclose(model.predict(X), reference.predict(X), rtol=1e-9, atol=1e-7)
+    assert model.get_coefficients()[0].shape == reference.get_coefficients()[0].shape
+
+
+def test_constant_feature_gets_zero_coefficient():
+    X, y = make_data()
+    X[:, 2] = 5.0
+    model = LinearRegressionModel()
+    model.partial_fit(X[:1000], y[:1000])
+    model.partial_fit(X[1000:], y[1000:])
+
+    assert model.get_coefficients()[0][2] == pytest.approx(0.0, abs=1e-9)
+    np.testing.assert_allclose(model.predict(X), full_refit(X, y).predict(X), rtol=1e-9, atol=1e-7)